@@ -7,14 +7,17 @@ Usage:
     python3 deploy_schedulers.py --dry-run # Show what would be deployed
 """
 
+import json
 import yaml
 import subprocess
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 PROJECT = "polar-scene-465223-f7"
 LOCATION = "europe-west1"
 SERVICE_ACCOUNT = "185493502538-compute@developer.gserviceaccount.com"
+MAX_WORKERS = 8  # Concurrent gcloud invocations
 
 
 def load_config():
@@ -23,39 +26,59 @@ def load_config():
         return yaml.safe_load(f)
 
 
-def scheduler_exists(name):
-    """Check if scheduler already exists."""
+def list_existing_schedulers():
+    """Return deployed schedulers as {name: job} (single gcloud call)."""
     result = subprocess.run(
         [
             "gcloud",
             "scheduler",
             "jobs",
-            "describe",
-            name,
+            "list",
             "--location",
             LOCATION,
             "--project",
             PROJECT,
             "--format",
-            "value(name)",
+            "json",
         ],
         capture_output=True,
         text=True,
     )
-    return result.returncode == 0
-
+    if result.returncode != 0:
+        print("❌ Failed to list existing schedulers")
+        print(result.stderr)
+        sys.exit(1)
+    return {job["name"].rsplit("/", 1)[-1]: job for job in json.loads(result.stdout)}
 
-def create_or_update_scheduler(scheduler, dry_run=False):
-    """Create or update a scheduler."""
-    name = scheduler["name"]
-    workflow = scheduler["workflow"]
 
-    uri = (
+def workflow_uri(workflow):
+    """Workflow executions endpoint triggered by a scheduler."""
+    return (
         f"https://workflowexecutions.googleapis.com/v1/"
         f"projects/{PROJECT}/locations/{LOCATION}/workflows/{workflow}/executions"
     )
 
-    exists = scheduler_exists(name)
+
+def is_up_to_date(scheduler, job):
+    """Whether the deployed job already matches the YAML definition."""
+    http_target = job.get("httpTarget", {})
+    return (
+        job.get("schedule") == scheduler["schedule"]
+        and job.get("timeZone") == scheduler["timezone"]
+        and job.get("description") == scheduler["description"]
+        and http_target.get("uri") == workflow_uri(scheduler["workflow"])
+        and http_target.get("oauthToken", {}).get("serviceAccountEmail")
+        == SERVICE_ACCOUNT
+    )
+
+
+def create_or_update_scheduler(scheduler, exists, dry_run=False):
+    """Create or update a scheduler. Returns False if gcloud failed."""
+    name = scheduler["name"]
+    workflow = scheduler["workflow"]
+
+    uri = workflow_uri(workflow)
+
     action = "update" if exists else "create"
 
     cmd = [
@@ -88,17 +111,17 @@ def create_or_update_scheduler(scheduler, dry_run=False):
         print(f"  Schedule: {scheduler['schedule']}")
         print(f"  Workflow: {workflow}")
         print()
-        return
+        return True
 
     print(f"{'Updating' if exists else 'Creating'} scheduler: {name}")
     result = subprocess.run(cmd, capture_output=True, text=True)
 
     if result.returncode == 0:
         print(f"✅ {name} {action}d successfully")
-    else:
-        print(f"❌ Failed to {action} {name}")
-        print(result.stderr)
-        sys.exit(1)
+        return True
+    print(f"❌ Failed to {action} {name}")
+    print(result.stderr)
+    return False
 
 
 def main():
@@ -117,8 +140,29 @@ def main():
         f"🕐 {'[DRY RUN] ' if args.dry_run else ''}Deploying {len(schedulers)} schedulers...\n"
     )
 
+    # One list call replaces a describe per job; jobs already matching the
+    # YAML are skipped, the others are created/updated in parallel
+    existing = list_existing_schedulers()
+    changed = []
     for scheduler in schedulers:
-        create_or_update_scheduler(scheduler, dry_run=args.dry_run)
+        job = existing.get(scheduler["name"])
+        if job is not None and is_up_to_date(scheduler, job):
+            print(f"⏭️  {scheduler['name']} unchanged, skipping")
+        else:
+            changed.append(scheduler)
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(
+            executor.map(
+                lambda s: create_or_update_scheduler(
+                    s, s["name"] in existing, dry_run=args.dry_run
+                ),
+                changed,
+            )
+        )
+
+    if not all(results):
+        sys.exit(1)
 
     if args.dry_run:
         print("🔍 Dry run completed. No changes were made.")
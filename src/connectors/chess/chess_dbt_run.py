@@ -14,12 +14,19 @@ Usage:
 """
 
 import argparse
+import os
 import subprocess
 import sys
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    # In-process invocation: no interpreter + dbt import cost per command
+    from dbt.cli.main import dbtRunner
+except ImportError:  # dbt extra not installed here: fall back to `uv run dbt`
+    dbtRunner = None
+
 
 def setup_logging():
     """Configure logging for DBT operations."""
@@ -48,6 +55,25 @@ def validate_environment(env: str):
         raise ValueError("Environment must be 'dev' or 'prd'")
 
 
+def invoke_dbt(args: list, dbt_dir: str):
+    """
+    Run a dbt command in-process from the project directory.
+
+    Args:
+        args: dbt arguments, without the leading "dbt"
+        dbt_dir: Path to DBT project directory
+
+    Returns:
+        dbtRunnerResult with `success` and `result` attributes
+    """
+    previous_cwd = os.getcwd()
+    os.chdir(dbt_dir)  # profiles.yml is looked up from the working directory
+    try:
+        return dbtRunner().invoke(args)
+    finally:
+        os.chdir(previous_cwd)
+
+
 def run_dbt_command(dbt_dir: str, env: str, models: str = None) -> bool:
     """
     Execute dbt run command for Chess.com lake models.
@@ -96,6 +122,20 @@ def run_dbt_command(dbt_dir: str, env: str, models: str = None) -> bool:
     logger.info(f"Target environment: {env.upper()}")
     logger.info(f"Working directory: {dbt_dir}")
 
+    if dbtRunner is not None:
+        try:
+            # dbt logs to stdout itself while running in-process
+            res = invoke_dbt(cmd[3:], dbt_dir)
+        except Exception as e:
+            logger.error(f"❌ Unexpected error running DBT: {e}")
+            return False
+
+        if res.success:
+            logger.info("✅ DBT run completed successfully")
+            return True
+        logger.error(f"❌ DBT run failed: {res.exception or 'model errors'}")
+        return False
+
     try:
         # Execute the command
         result = subprocess.run(
@@ -152,6 +192,19 @@ def get_models_summary(dbt_dir: str, env: str) -> dict:
         dbt_dir,
     ]
 
+    if dbtRunner is not None:
+        try:
+            res = invoke_dbt(cmd[3:] + ["--quiet"], dbt_dir)
+        except Exception as e:
+            logger.warning(f"Error getting models summary: {e}")
+            return {"total_models": 0, "models": []}
+
+        if res.success and res.result:
+            models = list(res.result)
+            return {"total_models": len(models), "models": models}
+        logger.warning("Could not get models list")
+        return {"total_models": 0, "models": []}
+
     try:
         result = subprocess.run(
             cmd, cwd=dbt_dir, capture_output=True, text=True, check=False
@@ -11,15 +11,33 @@ Features:
 """
 import sys
 import argparse
+import calendar
+import json
 import logging
+import os
+import re
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from pathlib import Path
 from typing import List, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import requests_cache
+except ImportError:  # HTTP caching is optional
+    requests_cache = None
+
+try:
+    import ijson
+except ImportError:  # Streaming parse of monthly archives is optional
+    ijson = None
 
 sys.path.append(str(Path(__file__).parent.parent))
 from utils import to_jsonl
@@ -29,6 +47,13 @@ DEFAULT_DAYS_BACK = 30
 DEFAULT_TIMEZONE = "Europe/Paris"
 BASE_URL = "https://api.chess.com/pub"
 RATE_LIMIT_DELAY = 1.0  # Seconds between API calls
+MAX_WORKERS = 4  # Concurrent monthly archive downloads
+REQUEST_TIMEOUT = (3.05, 30)  # (connect, read) seconds
+CACHE_FILE = Path(__file__).parent / ".chess_cache"
+CACHE_EXPIRE_SECONDS = 300
+ARCHIVES_CACHE_TTL = 6 * 3600  # Seconds an on-disk archives list stays fresh
+
+_ARCHIVE_USER_RE = re.compile(r"/player/([^/]+)/games/")
 
 
 # Data types to fetch
@@ -48,6 +73,7 @@ class ChessComConfig:
     output_dir: Path
     timezone: str = DEFAULT_TIMEZONE
     rate_limit_delay: float = RATE_LIMIT_DELAY
+    max_workers: int = MAX_WORKERS
 
 
 class ChessComConnectorError(Exception):
@@ -56,29 +82,101 @@ class ChessComConnectorError(Exception):
     pass
 
 
+def _month_bounds(year: int, month: int) -> tuple:
+    """First and last epoch second of a calendar month (UTC, like archives)."""
+    last_day = calendar.monthrange(year, month)[1]
+    return (
+        calendar.timegm((year, month, 1, 0, 0, 0)),
+        calendar.timegm((year, month, last_day, 23, 59, 59)),
+    )
+
+
+def _wrap_single(fetch_fn) -> List[Dict[str, Any]]:
+    """Call a single-object fetcher once and wrap its result in a list."""
+    result = fetch_fn()
+    return [result] if result else []
+
+
 class ChessComConnector:
     """Chess.com data connector with support for multiple data types."""
 
     def __init__(self, config: ChessComConfig):
         """Initialize the Chess.com connector."""
         self.config = config
-        self.session = requests.Session()
+        self.session = self._build_session()
+        # Pooled keep-alive connections (at least one per worker) so archive
+        # downloads never reopen TLS sessions. Transient errors (429 / 5xx)
+        # are retried by urllib3 with backoff, honouring Retry-After.
+        retries = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=max(16, config.max_workers),
+                max_retries=retries,
+            ),
+        )
+        # Rate limiter: monotonic time of the next allowed request, shared
+        # by the worker threads
+        self._next_allowed = 0.0
+        self._rate_lock = threading.Lock()
+        # (archive_urls, actual_username), memoized for the process lifetime
+        self._archives = None
         self.session.headers.update(
             {"User-Agent": "ELA-DataPlatform/1.0 (https://github.com/ela-dataplatform)"}
         )
 
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Create the HTTP session, with ETag/Last-Modified caching if available.
+
+        Chess.com serves ETag and Last-Modified headers: with requests_cache,
+        unchanged resources (closed monthly archives, profile) are revalidated
+        with a conditional GET and come back as an empty 304.
+        """
+        if requests_cache is None:
+            return requests.Session()
+        return requests_cache.CachedSession(
+            str(CACHE_FILE),
+            backend="sqlite",
+            cache_control=True,
+            expire_after=CACHE_EXPIRE_SECONDS,
+            allowable_methods=("GET",),
+        )
+
+    def _acquire_slot(self) -> None:
+        """Wait for the next request slot.
+
+        Only the interval *between* two requests is enforced: an idle
+        connector never waits, and there is no trailing sleep after the last
+        call. Slots are reserved under the lock, the wait happens outside it.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_allowed - now
+            self._next_allowed = max(self._next_allowed, now) + (
+                self.config.rate_limit_delay
+            )
+        if wait > 0:
+            time.sleep(wait)
+
     def _make_request(self, endpoint: str) -> Dict[str, Any]:
         """Make a rate-limited request to Chess.com API."""
         url = f"{BASE_URL}/{endpoint.lstrip('/')}"
 
         try:
+            self._acquire_slot()
             logging.debug(f"Making request to: {url}")
-            response = self.session.get(url)
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
 
-            # Rate limiting
-            time.sleep(self.config.rate_limit_delay)
-
             return response.json()
 
         except requests.exceptions.HTTPError as e:
@@ -91,6 +189,33 @@ class ChessComConnector:
         except ValueError as e:
             raise ChessComConnectorError(f"JSON decode error: {e}")
 
+    def _stream_games(self, endpoint: str):
+        """Yield the games of a monthly archive one by one as they are received.
+
+        Only used when ijson is available: the month is never parsed as a
+        whole, so memory stays at one game regardless of the archive size.
+        """
+        url = f"{BASE_URL}/{endpoint.lstrip('/')}"
+
+        try:
+            self._acquire_slot()
+            logging.debug(f"Streaming request to: {url}")
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT, stream=True)
+            with response:
+                if response.status_code == 404:
+                    logging.warning(f"Resource not found: {url}")
+                    return
+                response.raise_for_status()
+                response.raw.decode_content = True  # gzip handled by urllib3
+                yield from ijson.items(response.raw, "games.item", use_float=True)
+
+        except requests.exceptions.HTTPError as e:
+            raise ChessComConnectorError(f"HTTP error {response.status_code}: {e}")
+        except requests.exceptions.RequestException as e:
+            raise ChessComConnectorError(f"Request failed: {e}")
+        except ijson.JSONError as e:
+            raise ChessComConnectorError(f"JSON decode error: {e}")
+
     def fetch_player_profile(self) -> Dict[str, Any]:
         """Fetch player profile information."""
         try:
@@ -117,76 +242,158 @@ class ChessComConnector:
             logging.error(f"Error fetching player stats: {e}")
             return {}
 
-    def fetch_games(
-        self, start_date: datetime, end_date: datetime
-    ) -> List[Dict[str, Any]]:
-        """Fetch games within date range."""
+    def _archives_cache_file(self) -> Path:
+        """On-disk cache of the archives list, next to the dumps."""
+        return (
+            self.config.output_dir / ".cache" / f"archives_{self.config.username}.json"
+        )
+
+    def _get_archives(self) -> tuple:
+        """Return (archive_urls, actual_username).
+
+        The list is memoized in the connector and cached on disk for
+        ARCHIVES_CACHE_TTL, so re-runs within a few hours skip the request.
+        """
+        if self._archives is not None:
+            return self._archives
+
+        cache_file = self._archives_cache_file()
+        archive_urls = None
         try:
-            # First get archives list
+            if cache_file.stat().st_mtime > time.time() - ARCHIVES_CACHE_TTL:
+                archive_urls = json.loads(cache_file.read_text())
+                logging.debug(f"Archives list loaded from {cache_file}")
+        except (OSError, ValueError):
+            archive_urls = None
+
+        if archive_urls is None:
             archives = self._make_request(
                 f"player/{self.config.username}/games/archives"
             )
             archive_urls = archives.get("archives", [])
-
-            # Extract the actual username from the archive URLs (handles case redirection)
-            actual_username = self.config.username
             if archive_urls:
-                # Extract username from first archive URL
-                import re
+                try:
+                    # Atomic write: a concurrent run never reads a partial file
+                    cache_file.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_file = cache_file.with_suffix(".tmp")
+                    tmp_file.write_text(json.dumps(archive_urls))
+                    os.replace(tmp_file, cache_file)
+                except OSError as e:
+                    logging.debug(f"Could not cache archives list: {e}")
+
+        # Extract the actual username from the archive URLs (handles case redirection)
+        actual_username = self.config.username
+        if archive_urls:
+            match = _ARCHIVE_USER_RE.search(archive_urls[0])
+            if match:
+                actual_username = match.group(1)
+
+        self._archives = (archive_urls, actual_username)
+        return self._archives
+
+    def _fetch_month_games(
+        self,
+        username: str,
+        year_month: str,
+        start_ts: float,
+        end_ts: float,
+        fetch_ts: str,
+        full_month: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Fetch one monthly archive and keep the games within the date range.
 
-                match = re.search(r"/player/([^/]+)/games/", archive_urls[0])
-                if match:
-                    actual_username = match.group(1)
+        With full_month, the whole archive lies inside the range and the
+        per-game timestamp check is skipped.
+        """
+        endpoint = f"player/{username}/games/{year_month}"
+        try:
+            if ijson is not None and not full_month:
+                # Boundary month: filter games as they stream in
+                games = self._stream_games(endpoint)
+            else:
+                games = self._make_request(endpoint).get("games", [])
+
+            if full_month:
+                for game in games:
+                    game["data_type"] = "games"
+                    game["fetch_timestamp"] = fetch_ts
+                logging.info(f"Fetched {len(games)} games from {year_month}")
+                return games
+
+            # Filter games by date range: raw epoch seconds against
+            # precomputed bounds, no datetime built per game
+            filtered_games = []
+            logging.debug(f"Processing games from {year_month}")
+            for game in games:
+                if start_ts <= game.get("end_time", 0) <= end_ts:
+                    game["data_type"] = "games"
+                    game["fetch_timestamp"] = fetch_ts
+                    filtered_games.append(game)
+
+            logging.info(f"Fetched {len(filtered_games)} games from {year_month}")
+            return filtered_games
 
-            games_data = []
-            current_date = start_date.replace(day=1)  # Start from first day of month
+        except Exception as e:
+            logging.warning(f"Could not fetch games for {year_month}: {e}")
+            return []
+
+    def fetch_games(
+        self, start_date: datetime, end_date: datetime
+    ) -> List[Dict[str, Any]]:
+        """Fetch games within date range."""
+        try:
+            archive_urls, actual_username = self._get_archives()
+            archive_set = frozenset(archive_urls)
+
+            # Months of the range that actually have an archive, walked as
+            # plain (year, month) ints
+            year_months = []
             logging.debug(f"Available archives: {archive_urls}")
+            archive_prefix = f"{BASE_URL}/player/{actual_username}/games/"
+            year, month = start_date.year, start_date.month
+            end_ym = (end_date.year, end_date.month)
 
-            while current_date <= end_date:
-                year_month = current_date.strftime("%Y/%m")
-                archive_url = f"{BASE_URL}/player/{actual_username}/games/{year_month}"
+            while (year, month) <= end_ym:
+                year_month = f"{year:04d}/{month:02d}"
+                archive_url = archive_prefix + year_month
                 logging.debug(f"Checking for archive: {archive_url}")
 
-                if archive_url in archive_urls:
-                    try:
-                        month_games = self._make_request(
-                            f"player/{actual_username}/games/{year_month}"
-                        )
-                        games = month_games.get("games", [])
-
-                        # Filter games by date range
-                        filtered_games = []
-                        logging.debug(
-                            f"Processing {len(games)} games from {year_month}"
-                        )
-                        for game in games:
-                            game_date = datetime.fromtimestamp(game.get("end_time", 0))
-                            # Convert to timezone-naive for comparison
-                            start_date_naive = start_date.replace(tzinfo=None)
-                            end_date_naive = end_date.replace(tzinfo=None)
-                            logging.debug(
-                                f"Game date: {game_date}, Range: {start_date_naive} to {end_date_naive}"
-                            )
-                            if start_date_naive <= game_date <= end_date_naive:
-                                game["data_type"] = "games"
-                                game["fetch_timestamp"] = datetime.now().isoformat()
-                                filtered_games.append(game)
-
-                        games_data.extend(filtered_games)
-                        logging.info(
-                            f"Fetched {len(filtered_games)} games from {year_month}"
-                        )
-
-                    except Exception as e:
-                        logging.warning(f"Could not fetch games for {year_month}: {e}")
+                if archive_url in archive_set:
+                    year_months.append((year, month))
 
                 # Move to next month
-                if current_date.month == 12:
-                    current_date = current_date.replace(
-                        year=current_date.year + 1, month=1
-                    )
-                else:
-                    current_date = current_date.replace(month=current_date.month + 1)
+                month += 1
+                if month == 13:
+                    year, month = year + 1, 1
+
+            if not year_months:
+                logging.info("No archive in the requested date range")
+                return []
+
+            # Monthly archives are independent: download them concurrently
+            # (the shared rate limiter still spaces the requests), results keep
+            # the chronological order of year_months
+            # Bounds and fetch timestamp computed once for every game
+            # (timezone-naive, like the epoch end_time of each game)
+            start_ts = start_date.replace(tzinfo=None).timestamp()
+            end_ts = end_date.replace(tzinfo=None).timestamp()
+            fetch_ts = datetime.now().isoformat()
+
+            def fetch_month(ym: tuple) -> List[Dict[str, Any]]:
+                month_start, month_end = _month_bounds(*ym)
+                return self._fetch_month_games(
+                    actual_username,
+                    f"{ym[0]:04d}/{ym[1]:02d}",
+                    start_ts,
+                    end_ts,
+                    fetch_ts,
+                    full_month=start_ts <= month_start and month_end <= end_ts,
+                )
+
+            max_workers = min(self.config.max_workers, len(year_months))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                monthly_games = executor.map(fetch_month, year_months)
+                games_data = [game for games in monthly_games for game in games]
 
             logging.info(f"Fetched total of {len(games_data)} games")
             return games_data
@@ -198,12 +405,8 @@ class ChessComConnector:
     def fetch_data(self, data_type: DataType, **kwargs) -> List[Dict[str, Any]]:
         """Generic method to fetch data by type."""
         method_map = {
-            DataType.PLAYER_PROFILE: lambda: (
-                [self.fetch_player_profile()] if self.fetch_player_profile() else []
-            ),
-            DataType.PLAYER_STATS: lambda: (
-                [self.fetch_player_stats()] if self.fetch_player_stats() else []
-            ),
+            DataType.PLAYER_PROFILE: lambda: _wrap_single(self.fetch_player_profile),
+            DataType.PLAYER_STATS: lambda: _wrap_single(self.fetch_player_stats),
             DataType.GAMES: lambda: self.fetch_games(**kwargs),
         }
 
@@ -293,6 +496,12 @@ def parse_args() -> argparse.Namespace:
         default=RATE_LIMIT_DELAY,
         help="Delay between API calls in seconds",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=MAX_WORKERS,
+        help="Number of monthly game archives downloaded concurrently",
+    )
 
     return parser.parse_args()
 
@@ -309,6 +518,7 @@ def main() -> None:
             output_dir=args.output_dir,
             timezone=args.timezone,
             rate_limit_delay=args.rate_limit,
+            max_workers=args.max_workers,
         )
 
         connector = ChessComConnector(config)
@@ -321,18 +531,24 @@ def main() -> None:
             f"Fetching Chess.com data for {args.username} from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
         )
 
-        # Fetch each data type
-        for data_type_str in args.data_types:
-            data_type = DataType(data_type_str)
+        # Data types are independent resources: fetch them concurrently
+        # (games' archive fan-out overlaps with profile and stats)
+        data_types = [DataType(data_type_str) for data_type_str in args.data_types]
+
+        def fetch(data_type: DataType) -> List[Dict[str, Any]]:
             logging.info(f"📊 Fetching {data_type.value} data...")
+            # Prepare kwargs for games data type
+            fetch_kwargs = {}
+            if data_type == DataType.GAMES:
+                fetch_kwargs = {"start_date": start_date, "end_date": end_date}
+            return connector.fetch_data(data_type, **fetch_kwargs)
 
-            try:
-                # Prepare kwargs for games data type
-                fetch_kwargs = {}
-                if data_type == DataType.GAMES:
-                    fetch_kwargs = {"start_date": start_date, "end_date": end_date}
+        with ThreadPoolExecutor(max_workers=len(data_types) or 1) as executor:
+            futures = {dt: executor.submit(fetch, dt) for dt in data_types}
 
-                data = connector.fetch_data(data_type, **fetch_kwargs)
+        for data_type, future in futures.items():
+            try:
+                data = future.result()
                 output_file = generate_output_filename(
                     args.output_dir, data_type, args.username, args.timezone
                 )
@@ -17,10 +17,37 @@ Usage:
 """
 
 import argparse
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from google.cloud import bigquery, storage
+from google.api_core.exceptions import NotFound
 import os
-import json
+
+# Délimiteur CSV qui n'apparaît jamais dans du JSON : chaque ligne JSONL est lue
+# comme une seule colonne STRING par la table externe
+LINE_DELIMITER = "\x1f"
+
+# Files are processed concurrently; BigQuery jobs are capped separately to stay
+# well below the project's concurrent job quota
+MAX_WORKERS = 8
+MAX_CONCURRENT_BQ_JOBS = 4
+_bq_jobs = threading.Semaphore(MAX_CONCURRENT_BQ_JOBS)
+
+# "..._chess_{username}_{data_type}...": the two "_"-separated parts after "chess"
+_FILENAME_RE = re.compile(r"(?:^|_)chess_([^_]*)_([^_]*)")
+_FALLBACK_USER_RE = re.compile(r"(?:^|_)chess_([^_]*)")
+
+# Fallback detection based on keywords
+_TYPE_KEYWORDS = {
+    "player_profile": ["profile"],
+    "player_stats": ["stats"],
+    "games": ["games"],
+    "clubs": ["clubs"],
+    "tournaments": ["tournaments"],
+}
 
 
 def get_env_config(env: str):
@@ -69,6 +96,11 @@ def get_universal_schema():
     ]
 
 
+# Built once: schema objects are reused by every table check / file load
+_UNIVERSAL_SCHEMA = get_universal_schema()
+_LINE_SCHEMA = [bigquery.SchemaField("line", "STRING")]
+
+
 def detect_file_type_and_username(filename: str) -> tuple:
     """
     Detect the type of Chess.com data file based on filename patterns.
@@ -78,54 +110,37 @@ def detect_file_type_and_username(filename: str) -> tuple:
 
     Returns: (data_type, username)
     """
-    filename_lower = filename.lower()
-
-    # Extract username and data type from filename pattern
-    try:
-        # Split filename and remove extension
-        name_parts = filename.replace(".jsonl", "").split("_")
-
-        # Find 'chess' identifier
-        chess_index = -1
-        for i, part in enumerate(name_parts):
-            if part == "chess":
-                chess_index = i
-                break
-
-        if chess_index >= 0 and len(name_parts) > chess_index + 2:
-            username = name_parts[chess_index + 1]
-            data_type = name_parts[chess_index + 2]
-            return data_type, username
-
-    except Exception:
-        pass
-
-    # Fallback detection based on keywords
-    type_mapping = {
-        "player_profile": ["profile"],
-        "player_stats": ["stats"],
-        "games": ["games"],
-        "clubs": ["clubs"],
-        "tournaments": ["tournaments"],
-    }
+    match = _FILENAME_RE.search(filename.replace(".jsonl", ""))
+    if match:
+        username, data_type = match.groups()
+        return data_type, username
 
-    for data_type, keywords in type_mapping.items():
+    filename_lower = filename.lower()
+    for data_type, keywords in _TYPE_KEYWORDS.items():
         if any(keyword in filename_lower for keyword in keywords):
             # Try to extract username if possible
-            parts = filename_lower.split("_")
-            username = "unknown"
-            for i, part in enumerate(parts):
-                if part == "chess" and i + 1 < len(parts):
-                    username = parts[i + 1]
-                    break
+            user_match = _FALLBACK_USER_RE.search(filename_lower)
+            username = user_match.group(1) if user_match else "unknown"
             return data_type, username
 
     return "unknown", "unknown"
 
 
+@lru_cache(maxsize=1)
+def get_storage_client() -> storage.Client:
+    """Storage client shared by listing and moves (thread-safe for these calls)."""
+    return storage.Client()
+
+
+@lru_cache(maxsize=1)
+def get_bigquery_client() -> bigquery.Client:
+    """BigQuery client shared by every file load: auth is resolved once."""
+    return bigquery.Client()
+
+
 def list_gcs_files(bucket_name: str, prefix: str = "chess/landing/") -> list:
     """List JSONL files in GCS bucket with given prefix."""
-    client = storage.Client()
+    client = get_storage_client()
     blobs = client.list_blobs(bucket_name, prefix=prefix)
     return [
         f"gs://{bucket_name}/{blob.name}"
@@ -136,7 +151,7 @@ def list_gcs_files(bucket_name: str, prefix: str = "chess/landing/") -> list:
 
 def move_gcs_file(bucket_name: str, source_path: str, dest_prefix: str):
     """Move GCS file from source to destination path."""
-    client = storage.Client()
+    client = get_storage_client()
     bucket = client.bucket(bucket_name)
     source_blob = bucket.blob(source_path)
     filename = source_path.split("/")[-1]
@@ -146,6 +161,31 @@ def move_gcs_file(bucket_name: str, source_path: str, dest_prefix: str):
     print(f"📁 {source_path} moved to {dest_path}")
 
 
+def get_line_external_config(uri: str) -> bigquery.ExternalConfig:
+    """External table reading each JSONL line of `uri` as a single `line` column."""
+    external_config = bigquery.ExternalConfig("CSV")
+    external_config.source_uris = [uri]
+    external_config.schema = _LINE_SCHEMA
+    external_config.options.field_delimiter = LINE_DELIMITER
+    external_config.options.quote_character = ""
+    external_config.options.allow_jagged_rows = True
+    external_config.options.encoding = "UTF-8"
+    return external_config
+
+
+@lru_cache(maxsize=None)
+def ensure_raw_table(table_id: str) -> None:
+    """Create the raw table if missing; checked once per table and process."""
+    bq_client = get_bigquery_client()
+    try:
+        bq_client.get_table(table_id)
+    except NotFound:
+        # INSERT needs the table; the former load job created it on first run
+        bq_client.create_table(
+            bigquery.Table(table_id, schema=_UNIVERSAL_SCHEMA), exists_ok=True
+        )
+
+
 def load_jsonl_as_raw_json(
     uri: str, table_id: str, inserted_at: str, file_type: str, username: str
 ):
@@ -154,69 +194,50 @@ def load_jsonl_as_raw_json(
 
     Philosophy: Store everything as raw JSON, let dbt handle the rest.
     This approach guarantees no schema mismatch errors.
+
+    The file never transits through the client: BigQuery reads it from GCS
+    through a temporary external table and wraps each line server-side.
+    """
+    filename = uri.split("/")[-1]
+
+    bq_client = get_bigquery_client()
+    ensure_raw_table(table_id)
+
+    # Invalid lines are dropped by SAFE.PARSE_JSON, like the former client-side parse
+    query = f"""
+        INSERT INTO `{table_id}` (raw_data, data_type, username, dp_inserted_at, source_file)
+        SELECT raw_data, @file_type, @username, TIMESTAMP(@inserted_at), @filename
+        FROM (
+            SELECT SAFE.PARSE_JSON(line) AS raw_data
+            FROM jsonl_file
+            WHERE TRIM(line) != ''
+        )
+        WHERE raw_data IS NOT NULL
     """
-    from google.cloud import bigquery, storage
-    import json
-
-    # Parse GCS URI
-    parts = uri.split("/")
-    bucket_name = parts[2]
-    blob_path = "/".join(parts[3:])
-    filename = parts[-1]
-
-    # Download from GCS
-    storage_client = storage.Client()
-    bucket = storage_client.bucket(bucket_name)
-    blob = bucket.blob(blob_path)
-    content = blob.download_as_text().splitlines()
-
-    rows = []
-    for line_num, line in enumerate(content, 1):
+    with _bq_jobs:
+        job = bq_client.query(
+            query,
+            job_config=bigquery.QueryJobConfig(
+                table_definitions={"jsonl_file": get_line_external_config(uri)},
+                query_parameters=[
+                    bigquery.ScalarQueryParameter("file_type", "STRING", file_type),
+                    bigquery.ScalarQueryParameter("username", "STRING", username),
+                    bigquery.ScalarQueryParameter("inserted_at", "STRING", inserted_at),
+                    bigquery.ScalarQueryParameter("filename", "STRING", filename),
+                ],
+            ),
+        )
+
         try:
-            # Parse original data (validation only)
-            original_data = json.loads(line)
-
-            # Create row with minimal structure - everything preserved as JSON
-            row = {
-                "raw_data": original_data,  # Complete original record
-                "data_type": file_type,  # For easy filtering in dbt
-                "username": username,  # Chess.com username
-                "dp_inserted_at": inserted_at,
-                "source_file": filename,
-            }
-
-            rows.append(row)
-
-        except json.JSONDecodeError as e:
-            print(f"⚠️  Invalid JSON on line {line_num} in {filename}: {e}")
-            continue
+            job.result()
         except Exception as e:
-            print(f"⚠️  Processing error on line {line_num} in {filename}: {e}")
-            continue
+            print(f"❌ BigQuery load error for {filename}: {e}")
+            raise
 
-    if not rows:
+    if not job.num_dml_affected_rows:
         raise ValueError(f"No valid records found in {filename}")
 
-    # Load to BigQuery with universal schema
-    bq_client = bigquery.Client()
-    job = bq_client.load_table_from_json(
-        rows,
-        table_id,
-        job_config=bigquery.LoadJobConfig(
-            schema=get_universal_schema(),
-            write_disposition="WRITE_APPEND",
-            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
-            # Enable auto-detection as fallback (though our schema should handle everything)
-            autodetect=False,
-        ),
-    )
-
-    try:
-        job.result()
-        print(f"✅ {filename} loaded with {len(rows)} rows to {table_id}")
-    except Exception as e:
-        print(f"❌ BigQuery load error for {filename}: {e}")
-        raise
+    print(f"✅ {filename} loaded with {job.num_dml_affected_rows} rows to {table_id}")
 
 
 if __name__ == "__main__":
@@ -245,30 +266,34 @@ if __name__ == "__main__":
     uris = list_gcs_files(bucket)
     print(f"📁 Found {len(uris)} files to process")
 
-    success_count = 0
-    error_count = 0
+    # Single table approach - all Chess.com data types in one raw table
+    table_id = f"{project_id}.{dataset}.lake_chess__stg_chess_raw"
 
-    for uri in uris:
+    def process_file(uri: str) -> bool:
+        """Load one landing file, then archive or reject it. Returns success."""
+        source_path = "/".join(uri.split("/")[3:])
         try:
             filename = uri.split("/")[-1]
             file_type, username = detect_file_type_and_username(filename)
 
-            # Single table approach - all Chess.com data types in one raw table
-            table_id = f"{project_id}.{dataset}.lake_chess__stg_chess_raw"
-
             print(f"📊 Processing {file_type} file for {username}: {filename}")
             load_jsonl_as_raw_json(uri, table_id, inserted_at, file_type, username)
 
             # Move to archive on success
-            source_path = "/".join(uri.split("/")[3:])
             move_gcs_file(bucket, source_path, "archive")
-            success_count += 1
+            return True
 
         except Exception as e:
             print(f"❌ Ingestion error for {uri}: {e}")
-            source_path = "/".join(uri.split("/")[3:])
             move_gcs_file(bucket, source_path, "rejected")
-            error_count += 1
+            return False
+
+    # Files are independent: load and move them concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(process_file, uris))
+
+    success_count = sum(results)
+    error_count = len(results) - success_count
 
     print(f"\n📈 Ingestion Summary:")
     print(f"✅ Successfully processed: {success_count} files")
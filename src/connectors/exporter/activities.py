@@ -6,11 +6,11 @@ Generates:
 - activity_{id}.json: Detail for each activity
 """
 
-import json
 import os
-from datetime import date, datetime, timezone
-from decimal import Decimal
-from google.cloud import bigquery, storage
+from datetime import datetime, timezone
+from google.cloud import bigquery
+
+from src.connectors.exporter.gcs import upload_to_gcs
 
 PROJECT_ID = os.getenv("GOOGLE_CLOUD_PROJECT", "polar-scene-465223-f7")
 DATASET = "dp_product_dev"
@@ -18,15 +18,6 @@ DATASET_HUB = "dp_hub_dev"
 GCS_BUCKET = os.getenv("GCS_EXPORT_BUCKET", "ela-dp-export")
 
 
-def json_serializer(obj):
-    """Custom JSON serializer for types not serializable by default."""
-    if isinstance(obj, (datetime, date)):
-        return obj.isoformat()
-    if isinstance(obj, Decimal):
-        return float(obj)
-    raise TypeError(f"Type {type(obj)} not serializable")
-
-
 def get_bq_client():
     return bigquery.Client(project=PROJECT_ID)
 
@@ -145,21 +136,6 @@ def fetch_activity_detail(client: bigquery.Client, activity_id: int) -> dict | N
     return data
 
 
-def upload_to_gcs(data: dict | list, bucket_name: str, blob_name: str) -> str:
-    """Upload JSON data to GCS and return GCS URI."""
-    client = storage.Client(project=PROJECT_ID)
-    bucket = client.bucket(bucket_name)
-    blob = bucket.blob(blob_name)
-
-    json_content = json.dumps(
-        data, default=json_serializer, ensure_ascii=False, indent=2
-    )
-
-    blob.upload_from_string(json_content, content_type="application/json")
-
-    return f"gs://{bucket_name}/{blob_name}"
-
-
 def export_activities(
     bucket_name: str | None = None,
     dry_run: bool = False,
@@ -8,25 +8,17 @@ Generates:
 import json
 import os
 from collections import defaultdict
-from datetime import date, datetime, timezone
-from decimal import Decimal
+from datetime import datetime, timezone
 
-from google.cloud import bigquery, storage
+from google.cloud import bigquery
+
+from src.connectors.exporter.gcs import json_serializer, upload_to_gcs
 
 PROJECT_ID = os.getenv("GOOGLE_CLOUD_PROJECT", "polar-scene-465223-f7")
 DATASET = "dp_product_dev"
 GCS_BUCKET = os.getenv("GCS_EXPORT_BUCKET", "ela-dp-export")
 
 
-def json_serializer(obj):
-    """Custom JSON serializer for types not serializable by default."""
-    if isinstance(obj, (datetime, date)):
-        return obj.isoformat()
-    if isinstance(obj, Decimal):
-        return float(obj)
-    raise TypeError(f"Type {type(obj)} not serializable")
-
-
 def get_bq_client():
     return bigquery.Client(project=PROJECT_ID)
 
@@ -95,16 +87,6 @@ def group_by_artist(rows: list[dict]) -> dict[str, list[dict]]:
     return grouped
 
 
-def upload_to_gcs(data: dict, bucket_name: str, blob_name: str) -> str:
-    client = storage.Client(project=PROJECT_ID)
-    blob = client.bucket(bucket_name).blob(blob_name)
-    blob.upload_from_string(
-        json.dumps(data, default=json_serializer, ensure_ascii=False, indent=2),
-        content_type="application/json",
-    )
-    return f"gs://{bucket_name}/{blob_name}"
-
-
 def export_artist_focus(
     bucket_name: str | None = None,
     dry_run: bool = False,
@@ -0,0 +1,42 @@
+"""
+Shared JSON serialization and GCS upload helpers for the exporters.
+"""
+
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+
+from google.cloud import storage
+
+PROJECT_ID = os.getenv("GOOGLE_CLOUD_PROJECT", "polar-scene-465223-f7")
+
+
+def json_serializer(obj):
+    """Custom JSON serializer for types not serializable by default."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+@lru_cache(maxsize=1)
+def get_storage_client() -> storage.Client:
+    """Storage client shared by every upload of the process."""
+    return storage.Client(project=PROJECT_ID)
+
+
+def upload_to_gcs(data: dict | list, bucket_name: str, blob_name: str) -> str:
+    """Upload JSON data to GCS and return GCS URI."""
+    bucket = get_storage_client().bucket(bucket_name)
+    blob = bucket.blob(blob_name)
+
+    json_content = json.dumps(
+        data, default=json_serializer, ensure_ascii=False, indent=2
+    )
+
+    blob.upload_from_string(json_content, content_type="application/json")
+
+    return f"gs://{bucket_name}/{blob_name}"
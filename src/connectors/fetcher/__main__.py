@@ -19,11 +19,13 @@ Usage:
     python -m src.connectors.fetcher --list-types
 """
 import argparse
+import asyncio
 import logging
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Tuple
 
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
@@ -32,6 +34,9 @@ from src.connectors.fetcher.adapters import SpotifyAdapter, GarminAdapter
 from src.connectors.fetcher.gcs_writer import GCSWriter, LocalWriter
 
 
+logger = logging.getLogger(__name__)
+
+
 def setup_logging(level: str = "INFO") -> None:
     """Configure logging format and level."""
     logging.basicConfig(
@@ -48,15 +53,16 @@ def load_env(dotenv_path: Path) -> None:
 
         if dotenv_path.exists():
             load_dotenv(dotenv_path)
-            logging.debug(f"Loaded .env from {dotenv_path}")
+            logger.debug(f"Loaded .env from {dotenv_path}")
         else:
-            logging.debug(f".env file not found at {dotenv_path}")
+            logger.debug(f".env file not found at {dotenv_path}")
     except ImportError:
-        logging.debug("python-dotenv not installed, skipping .env file loading")
+        logger.debug("python-dotenv not installed, skipping .env file loading")
 
 
+@lru_cache(maxsize=None)
 def get_adapter(service: str):
-    """Get the appropriate adapter for a service."""
+    """Get the adapter for a service (one shared instance per service)."""
     if service == "spotify":
         return SpotifyAdapter()
     elif service == "garmin":
@@ -65,8 +71,81 @@ def get_adapter(service: str):
         raise ValueError(f"Unknown service: {service}")
 
 
+async def run_service(
+    service_name: str, data_types: List[str], days: int, limit: int, writer
+) -> Tuple[int, int, int]:
+    """
+    Authenticate one service, fetch its data types and write the results.
+
+    Returns:
+        Tuple of (success_count, error_count, empty_count); empty results
+        count as successes but are never handed to the writer
+    """
+    adapter = get_adapter(service_name)
+    success_count = 0
+    error_count = 0
+    empty_count = 0
+    # Uploads run alongside the remaining fetches instead of blocking them
+    writes = []
+
+    try:
+        # Authenticate
+        await asyncio.to_thread(adapter.authenticate, data_types)
+
+        # Fetch each data type
+        async for result in adapter.fetch_all_async(data_types, days=days, limit=limit):
+            if result.success:
+                if result.is_empty:
+                    empty_count += 1
+                elif writer:
+                    writes.append(asyncio.create_task(writer.write_async(result)))
+                success_count += 1
+                if result.is_streamed:
+                    logger.info("[%s] %s: streaming", result.service, result.data_type)
+                else:
+                    logger.info(
+                        "[%s] %s: %d items",
+                        result.service,
+                        result.data_type,
+                        result.item_count,
+                    )
+            else:
+                error_count += 1
+                logger.error(
+                    "[%s] %s failed: %s", result.service, result.data_type, result.error
+                )
+
+    except Exception as e:
+        logger.error("Failed to fetch from %s: %s", service_name, e)
+        error_count += len(data_types) - success_count - error_count
+
+    for outcome in await asyncio.gather(*writes, return_exceptions=True):
+        if isinstance(outcome, Exception):
+            logger.error("Failed to write %s result: %s", service_name, outcome)
+            success_count -= 1
+            error_count += 1
+        elif outcome is None:
+            # Streamed result that turned out empty once consumed
+            empty_count += 1
+
+    return success_count, error_count, empty_count
+
+
+async def run_services(
+    scope_by_service: Dict[str, List[str]], days: int, limit: int, writer
+) -> List[Tuple[int, int, int]]:
+    """Run every active service concurrently; returns their run_service counts."""
+    return await asyncio.gather(
+        *(
+            run_service(service_name, data_types, days, limit, writer)
+            for service_name, data_types in scope_by_service.items()
+            if data_types
+        )
+    )
+
+
 def auto_detect_service(
-    data_type: str, spotify_types: Set[str], garmin_types: Set[str]
+    data_type: str, spotify_types: FrozenSet[str], garmin_types: FrozenSet[str]
 ) -> str:
     """Auto-detect which service a data type belongs to."""
     if data_type in spotify_types:
@@ -191,12 +270,12 @@ def list_available_types() -> None:
     print("\nAvailable data types:\n")
 
     print("SPOTIFY:")
-    spotify = SpotifyAdapter()
+    spotify = get_adapter("spotify")
     for dt in spotify.available_data_types:
         print(f"  - {dt}")
 
     print("\nGARMIN:")
-    garmin = GarminAdapter()
+    garmin = get_adapter("garmin")
     for dt in garmin.available_data_types:
         print(f"  - {dt}")
 
@@ -215,13 +294,13 @@ def main() -> None:
 
     # Validate required arguments
     if not args.scope:
-        logging.error(
+        logger.error(
             "--scope is required. Use --list-types to see available data types."
         )
         sys.exit(1)
 
     if not args.destination and not args.output_dir:
-        logging.error("Either --destination (GCS) or --output-dir (local) is required.")
+        logger.error("Either --destination (GCS) or --output-dir (local) is required.")
         sys.exit(1)
 
     # Load environment variables
@@ -235,10 +314,10 @@ def main() -> None:
     scope_list = [s.strip() for s in args.scope.split(",")]
 
     # Get available types for each service
-    spotify_adapter = SpotifyAdapter()
-    garmin_adapter = GarminAdapter()
-    spotify_types = set(spotify_adapter.available_data_types)
-    garmin_types = set(garmin_adapter.available_data_types)
+    spotify_adapter = get_adapter("spotify")
+    garmin_adapter = get_adapter("garmin")
+    spotify_types = spotify_adapter.available_data_types_set
+    garmin_types = garmin_adapter.available_data_types_set
 
     # Organize scope by service
     scope_by_service: Dict[str, List[str]] = {"spotify": [], "garmin": []}
@@ -259,12 +338,12 @@ def main() -> None:
                     if detected in requested_services:
                         scope_by_service[detected].append(data_type)
                     else:
-                        logging.warning(
+                        logger.warning(
                             f"Data type '{data_type}' belongs to '{detected}' "
                             f"but only {requested_services} were requested. Skipping."
                         )
                 except ValueError as e:
-                    logging.error(str(e))
+                    logger.error(str(e))
                     sys.exit(1)
         else:
             # Auto-detect service from data type
@@ -272,20 +351,20 @@ def main() -> None:
                 detected = auto_detect_service(data_type, spotify_types, garmin_types)
                 scope_by_service[detected].append(data_type)
             except ValueError as e:
-                logging.error(str(e))
+                logger.error(str(e))
                 sys.exit(1)
 
     # Filter to services that have data types to fetch
     active_services = {s for s, types in scope_by_service.items() if types}
 
     if not active_services:
-        logging.error("No valid data types to fetch after filtering.")
+        logger.error("No valid data types to fetch after filtering.")
         sys.exit(1)
 
-    logging.info(f"Services to fetch: {active_services}")
+    logger.info(f"Services to fetch: {active_services}")
     for service, types in scope_by_service.items():
         if types:
-            logging.info(f"  {service}: {types}")
+            logger.info(f"  {service}: {types}")
 
     # Setup writer
     writer = None
@@ -297,41 +376,25 @@ def main() -> None:
     elif args.output_dir:
         writer = LocalWriter(args.output_dir)
 
-    # Fetch from each service
-    success_count = 0
-    error_count = 0
-
-    for service_name in active_services:
-        data_types = scope_by_service[service_name]
-        adapter = get_adapter(service_name)
-
-        try:
-            # Authenticate
-            adapter.authenticate(data_types)
-
-            # Fetch each data type
-            for result in adapter.fetch_all(
-                data_types, days=args.days, limit=args.limit
-            ):
-                if result.success:
-                    if writer:
-                        writer.write(result)
-                    success_count += 1
-                    logging.info(
-                        f"[{result.service}] {result.data_type}: {result.item_count} items"
-                    )
-                else:
-                    error_count += 1
-                    logging.error(
-                        f"[{result.service}] {result.data_type} failed: {result.error}"
-                    )
+    # Fetch from each service: services are independent (I/O bound), so they
+    # run concurrently
+    try:
+        counts = asyncio.run(
+            run_services(scope_by_service, args.days, args.limit, writer)
+        )
+    finally:
+        # Small payloads are queued by the GCS writer and uploaded together
+        failed_uploads = writer.flush() if writer else 0
 
-        except Exception as e:
-            logging.error(f"Failed to fetch from {service_name}: {e}")
-            error_count += len(data_types)
+    success_count = sum(ok for ok, _, _ in counts) - failed_uploads
+    error_count = sum(ko for _, ko, _ in counts) + failed_uploads
+    empty_count = sum(empty for _, _, empty in counts)
 
     # Summary
-    logging.info(f"Completed: {success_count} successful, {error_count} failed")
+    logger.info(
+        f"Completed: {success_count} successful ({empty_count} empty), "
+        f"{error_count} failed"
+    )
 
     if error_count > 0:
         sys.exit(1)
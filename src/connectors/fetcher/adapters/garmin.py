@@ -3,19 +3,54 @@ Garmin Adapter for the generic fetcher.
 Wraps the existing GarminClient and GarminFetcher to provide a unified interface.
 """
 
+import asyncio
 import logging
 import os
+import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List
 
-from ..base import ServiceAdapter, FetchResult
+from ..base import ServiceAdapter, FetchResult, cached_session_from
 
 logger = logging.getLogger(__name__)
 
+# Closed days (the watch has synced, see garmin.utils.closed_day_cutoff):
+# their responses are cached, open days are always fetched again
+CLOSED_DAY_CACHE_SECONDS = 7 * 24 * 3600
+_URL_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _is_closed_day_response(response) -> bool:
+    """Cache only responses whose URL dates are all closed days."""
+    dates = _URL_DATE_RE.findall(response.url)
+    return bool(dates) and max(dates) < _load_closed_day_cutoff()()
+
+
+@lru_cache(maxsize=1)
+def _load_data_types():
+    """Import the Garmin data types once per process (lazy: avoids circular imports)."""
+    from src.connectors.garmin.config import DATA_TYPES
+
+    return DATA_TYPES
+
+
+@lru_cache(maxsize=1)
+def _load_closed_day_cutoff():
+    """Import the Garmin closed-day cutoff once (shared with GarminFetcher's cache)."""
+    from src.connectors.garmin.utils import closed_day_cutoff
+
+    return closed_day_cutoff
+
 
 class GarminAdapter(ServiceAdapter):
     """Adapter wrapping existing GarminClient and GarminFetcher."""
 
+    # One data type at a time: GarminFetcher already runs each one's requests
+    # concurrently (MAX_CONCURRENT_REQUESTS in flight, paced by its adaptive
+    # rate limiter), so parallel data types would only queue on that budget
+    fetch_concurrency = 1
+
     def __init__(self):
         self._fetcher = None
         self._available_types = None
@@ -23,10 +58,7 @@ class GarminAdapter(ServiceAdapter):
     def _lazy_import(self):
         """Lazy import to avoid circular dependencies."""
         if self._available_types is None:
-            from src.connectors.garmin.config import DATA_TYPES
-
-            self._DATA_TYPES = DATA_TYPES
-            self._available_types = DATA_TYPES
+            self._DATA_TYPES = self._available_types = _load_data_types()
 
     @property
     def service_name(self) -> str:
@@ -48,7 +80,7 @@ class GarminAdapter(ServiceAdapter):
 
         # Validate data types
         for dt in data_types:
-            if dt not in self._available_types:
+            if dt not in self.available_data_types_set:
                 raise ValueError(
                     f"Unknown Garmin data type: {dt}. "
                     f"Available: {self._available_types}"
@@ -77,7 +109,28 @@ class GarminAdapter(ServiceAdapter):
 
         client_wrapper = GarminClient(env_vars)
         client = client_wrapper.get_client()
-        self._fetcher = GarminFetcher(client)
+
+        # garth's session already retries 5xx with backoff (429s are left to
+        # the fetcher's rate limiter) and has its keep-alive pool sized by
+        # GarminClient; it is wrapped in a response cache for closed days,
+        # which carries that HTTPS adapter over
+        garth_client = getattr(client, "garth", None)
+        http_cached = False
+        if garth_client is not None:
+            session = garth_client.sess
+            garth_client.sess = cached_session_from(
+                session,
+                expire_after=CLOSED_DAY_CACHE_SECONDS,
+                filter_fn=_is_closed_day_response,
+            )
+            http_cached = garth_client.sess is not session
+
+        # A closed day is cached by one layer only: the HTTP cache when it is
+        # installed, GarminFetcher's daily cache otherwise
+        if http_cached:
+            self._fetcher = GarminFetcher(client, cache_dir=None)
+        else:
+            self._fetcher = GarminFetcher(client)
 
         logger.info(f"Garmin authenticated for: {data_types}")
 
@@ -93,12 +146,23 @@ class GarminAdapter(ServiceAdapter):
         Returns:
             FetchResult with the fetched data.
         """
+        return asyncio.run(self.fetch_async(data_type, days=days, limit=limit))
+
+    async def fetch_async(
+        self, data_type: str, days: int = 1, limit: int = 50
+    ) -> FetchResult:
+        """
+        Async variant of fetch.
+
+        Awaits GarminFetcher.fetch_metric_async in the caller's event loop
+        instead of running a nested loop in a worker thread.
+        """
         self._lazy_import()
 
         if self._fetcher is None:
             raise RuntimeError("Not authenticated. Call authenticate() first.")
 
-        if data_type not in self._available_types:
+        if data_type not in self.available_data_types_set:
             return FetchResult(
                 service="garmin",
                 data_type=data_type,
@@ -108,12 +172,13 @@ class GarminAdapter(ServiceAdapter):
                 error=f"Unknown data type: {data_type}",
             )
 
-        timestamp = datetime.now()
-        end_date = datetime.now()
+        timestamp = end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
 
         try:
-            data = self._fetcher.fetch_metric(data_type, start_date, end_date)
+            data = await self._fetcher.fetch_metric_async(
+                data_type, start_date, end_date
+            )
 
             # Normalize to list
             if data is None:
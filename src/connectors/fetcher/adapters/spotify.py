@@ -6,17 +6,42 @@ Wraps the existing SpotifyConnector to provide a unified interface.
 import logging
 import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
-from ..base import ServiceAdapter, FetchResult
+from ..base import (
+    ServiceAdapter,
+    FetchResult,
+    cached_session_from,
+    widen_connection_pool,
+)
 
 logger = logging.getLogger(__name__)
 
+# Stable token cache location, independent of the working directory, so the
+# access token minted by one run is reused by the next
+TOKEN_CACHE_FILE = Path(__file__).resolve().parents[2] / ".spotify-cache"
+
+
+@lru_cache(maxsize=1)
+def _load_spotify_fetch():
+    """Import the Spotify connector once per process (lazy: avoids circular imports)."""
+    from src.connectors.spotify.spotify_fetch import (
+        SpotifyConnector,
+        SpotifyConfig,
+        DataType,
+    )
+
+    return SpotifyConnector, SpotifyConfig, DataType, {dt.value: dt for dt in DataType}
+
 
 class SpotifyAdapter(ServiceAdapter):
     """Adapter wrapping existing SpotifyConnector."""
 
+    # Independent Web API endpoints: fetched concurrently on the shared client
+    fetch_concurrency = 4
+
     def __init__(self):
         self._connector = None
         self._data_type_map = None
@@ -24,16 +49,12 @@ class SpotifyAdapter(ServiceAdapter):
     def _lazy_import(self):
         """Lazy import to avoid circular dependencies."""
         if self._data_type_map is None:
-            from src.connectors.spotify.spotify_fetch import (
-                SpotifyConnector,
-                SpotifyConfig,
-                DataType,
-            )
-
-            self._SpotifyConnector = SpotifyConnector
-            self._SpotifyConfig = SpotifyConfig
-            self._DataType = DataType
-            self._data_type_map = {dt.value: dt for dt in DataType}
+            (
+                self._SpotifyConnector,
+                self._SpotifyConfig,
+                self._DataType,
+                self._data_type_map,
+            ) = _load_spotify_fetch()
 
     @property
     def service_name(self) -> str:
@@ -86,7 +107,7 @@ class SpotifyAdapter(ServiceAdapter):
             client_secret=client_secret,
             redirect_uri=redirect_uri,
             refresh_token=refresh_token,
-            cache_path=Path(".spotify_cache"),
+            cache_path=TOKEN_CACHE_FILE,
         )
 
         self._connector = self._SpotifyConnector(config)
@@ -95,6 +116,17 @@ class SpotifyAdapter(ServiceAdapter):
         dt_enums = [self._data_type_map[dt] for dt in data_types]
         self._connector.authenticate(dt_enums)
 
+        # spotipy keeps one session for all calls (retries on 429/5xx already
+        # mounted): cache it and give it enough keep-alive connections for the
+        # fetch threads. Spotify's Cache-Control/ETag headers drive the cache:
+        # responses are stored but revalidated (If-None-Match) on every call,
+        # so a rerun gets 304s instead of full payloads, never stale data.
+        client = self._connector.client
+        client._session = cached_session_from(
+            client._session, cache_control=True, expire_after=0
+        )
+        widen_connection_pool(client._session)
+
         logger.info(f"Spotify authenticated for: {data_types}")
 
     def fetch(self, data_type: str, days: int = 1, limit: int = 50) -> FetchResult:
@@ -2,33 +2,141 @@
 Base classes for the generic fetcher.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Iterator
+from typing import (
+    List,
+    Dict,
+    Any,
+    Optional,
+    Iterable,
+    Iterator,
+    AsyncIterator,
+    FrozenSet,
+    Sized,
+)
+
+from requests.adapters import HTTPAdapter
+
+try:
+    import requests_cache
+except ImportError:  # Response caching is optional
+    requests_cache = None
+
+# SQLite response cache shared by the service adapters (".sqlite" is appended)
+CACHE_FILE = Path(__file__).parent / ".fetcher_cache"
+
+# Keep-alive connections per host for the service HTTP clients: at least one
+# per concurrent fetch, so pooled connections are never discarded
+HTTP_POOL_SIZE = 16
+
+
+def widen_connection_pool(session, pool_size: int = HTTP_POOL_SIZE) -> None:
+    """
+    Remount the HTTPS adapter of a requests session with a larger pool.
+
+    The retry policy configured by the client library is kept as-is.
+    """
+    current = session.get_adapter("https://")
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=current.max_retries,
+        ),
+    )
+
+
+def cached_session_from(session, **cache_options):
+    """
+    Swap a client library's requests session for a cached one.
+
+    Headers, cookies and the HTTPS adapter (retry policy, pool) are carried
+    over. Only GET responses are cached. Returns the session unchanged when
+    requests_cache is not installed.
+    """
+    if requests_cache is None:
+        return session
+
+    cached = requests_cache.CachedSession(
+        str(CACHE_FILE),
+        backend="sqlite",
+        allowable_methods=("GET",),
+        **cache_options,
+    )
+    cached.headers.update(session.headers)
+    cached.cookies.update(session.cookies)
+    cached.mount("https://", session.get_adapter("https://"))
+    return cached
 
 
 @dataclass
 class FetchResult:
-    """Result of a single data type fetch."""
+    """
+    Result of a single data type fetch.
+
+    `data` is either a list or a one-shot iterator of records. Iterators are
+    consumed by the writer through iter_data(), which streams them to the
+    destination without materializing the whole result.
+    """
 
     service: str
     data_type: str
-    data: List[Dict[str, Any]]
+    data: Iterable[Dict[str, Any]]
     timestamp: datetime
     success: bool
     error: Optional[str] = None
+    # Record count announced by adapters that know it up front (for logging)
+    known_count: Optional[int] = None
+    _streamed_count: int = field(default=0, init=False, repr=False, compare=False)
 
-    @property
+    @cached_property
     def filename(self) -> str:
-        """Generate standard filename for this result."""
+        """Generate standard filename for this result (formatted once)."""
         ts = self.timestamp.strftime("%Y_%m_%d_%H_%M")
         return f"{ts}_{self.service}_{self.data_type}.jsonl"
 
+    @property
+    def is_streamed(self) -> bool:
+        """Whether data is an iterator whose length is unknown before consuming it."""
+        return self.known_count is None and not isinstance(self.data, Sized)
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the result is known to hold no records (streams never are)."""
+        if self.known_count is not None:
+            return self.known_count == 0
+        return isinstance(self.data, Sized) and len(self.data) == 0
+
+    def iter_data(self) -> Iterator[Dict[str, Any]]:
+        """Yield the records once, counting them as they go."""
+        count = 0
+        try:
+            for item in self.data:
+                count += 1
+                yield item
+        finally:
+            self._streamed_count = count
+
     @property
     def item_count(self) -> int:
-        """Return number of items fetched."""
-        return len(self.data)
+        """
+        Return number of items fetched.
+
+        For streamed data without a known_count, this is the number of records
+        consumed so far (the full count once the writer is done).
+        """
+        if self.known_count is not None:
+            return self.known_count
+        if isinstance(self.data, Sized):
+            return len(self.data)
+        return self._streamed_count
 
 
 @dataclass
@@ -48,6 +156,9 @@ class FetchRequest:
 class ServiceAdapter(ABC):
     """Abstract base class for service adapters."""
 
+    # Data types fetched in parallel by fetch_all (1 = sequential)
+    fetch_concurrency: int = 1
+
     @property
     @abstractmethod
     def service_name(self) -> str:
@@ -60,6 +171,11 @@ class ServiceAdapter(ABC):
         """Return list of available data types for this service."""
         pass
 
+    @cached_property
+    def available_data_types_set(self) -> FrozenSet[str]:
+        """Available data types as a frozenset, for O(1) membership tests."""
+        return frozenset(self.available_data_types)
+
     @abstractmethod
     def authenticate(self, data_types: List[str]) -> None:
         """
@@ -97,7 +213,50 @@ class ServiceAdapter(ABC):
             limit: Maximum items to fetch (for Spotify).
 
         Yields:
-            FetchResult for each data type.
+            FetchResult for each data type, in completion order when
+            fetch_concurrency > 1.
+        """
+        max_workers = min(self.fetch_concurrency, len(data_types))
+        if max_workers <= 1:
+            for data_type in data_types:
+                yield self.fetch(data_type, days=days, limit=limit)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.fetch, data_type, days=days, limit=limit)
+                for data_type in data_types
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    async def fetch_async(
+        self, data_type: str, days: int = 1, limit: int = 50
+    ) -> FetchResult:
+        """
+        Async variant of fetch.
+
+        The service clients are blocking (requests-based): the call runs in a
+        worker thread so several fetches can be awaited together.
+        """
+        return await asyncio.to_thread(self.fetch, data_type, days=days, limit=limit)
+
+    async def fetch_all_async(
+        self, data_types: List[str], days: int = 1, limit: int = 50
+    ) -> AsyncIterator[FetchResult]:
+        """
+        Fetch multiple data types concurrently, at most fetch_concurrency at once.
+
+        Yields:
+            FetchResult for each data type, in completion order.
         """
-        for data_type in data_types:
-            yield self.fetch(data_type, days=days, limit=limit)
+        semaphore = asyncio.Semaphore(max(1, self.fetch_concurrency))
+
+        async def bounded_fetch(data_type: str) -> FetchResult:
+            async with semaphore:
+                return await self.fetch_async(data_type, days=days, limit=limit)
+
+        for next_result in asyncio.as_completed(
+            [bounded_fetch(data_type) for data_type in data_types]
+        ):
+            yield await next_result
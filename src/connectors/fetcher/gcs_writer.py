@@ -4,16 +4,92 @@ Handles direct upload of fetch results to Google Cloud Storage.
 """
 
 import json
+import asyncio
+import io
 import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Tuple
 
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
+from requests.adapters import HTTPAdapter
 
 from .base import FetchResult
 
+try:
+    import orjson
+except ImportError:  # Falls back to the stdlib encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# gs://bucket[/prefix]
+_GCS_PATH_RE = re.compile(r"gs://([^/]*)(?:/(.*))?", re.DOTALL)
+
+# Write buffer for JSONL files: per-line writes are coalesced into 1 MiB
+# (a multiple of the 4 KiB page size) syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+# Payload kept in RAM up to this size, spilled to a temp file beyond
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+# Resumable upload chunk size for payloads above the single-request limit
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# Payloads above this size are uploaded as concurrent chunks composed server-side
+CONCURRENT_UPLOAD_THRESHOLD = 32 * 1024 * 1024
+CONCURRENT_UPLOAD_WORKERS = 8
+# Connections kept per host: room for every concurrent upload thread (the
+# requests default of 10 would serialize them)
+HTTP_POOL_SIZE = 32
+# Payloads up to this size are queued and uploaded together by flush()
+BATCH_UPLOAD_MAX_SIZE = 1024 * 1024
+
+if orjson is not None:
+    # datetime / dataclass go through default=str, as with json.dumps
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+@lru_cache(maxsize=1)
+def get_storage_client() -> storage.Client:
+    """Process-wide storage client: credentials and connection pool set up once."""
+    client = storage.Client()
+    client._http.mount(
+        "https://",
+        HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE),
+    )
+    return client
+
+
+def iter_jsonl_lines(data: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """Yield one UTF-8 JSONL line (newline included) per item."""
+    if orjson is not None:
+        options = _ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+        for item in data:
+            yield orjson.dumps(item, default=str, option=options)
+    else:
+        for item in data:
+            line = json.dumps(item, default=str, ensure_ascii=False) + "\n"
+            yield line.encode("utf-8")
+
+
+def write_jsonl(data: Iterable[Dict[str, Any]], fh: BinaryIO) -> int:
+    """
+    Encode items line by line into a new binary file. Returns bytes written.
+
+    Lines go straight from the encoder into the file: no joined payload is
+    ever built in memory, and iterators are consumed as they produce.
+    """
+    fh.writelines(iter_jsonl_lines(data))
+    return fh.tell()
+
 
 class GCSWriter:
     """Handles writing fetch results to GCS."""
@@ -35,11 +111,17 @@ class GCSWriter:
         self.destination = destination
         self.keep_local = keep_local
         self.local_dir = local_dir
+        if keep_local and local_dir:
+            self.local_dir.mkdir(parents=True, exist_ok=True)
         self._bucket_name, self._prefix = self._parse_gcs_path(destination)
-        self._client = storage.Client()
+        self._client = get_storage_client()
         self._bucket = self._client.bucket(self._bucket_name)
+        # Small payloads waiting for flush(): (blob, content)
+        self._pending = []
+        self._pending_lock = threading.Lock()
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def _parse_gcs_path(path: str) -> Tuple[str, str]:
         """
         Parse gs://bucket/prefix into (bucket, prefix).
@@ -53,28 +135,91 @@ class GCSWriter:
         Raises:
             ValueError: If path is not a valid GCS path.
         """
-        if not path.startswith("gs://"):
+        match = _GCS_PATH_RE.fullmatch(path)
+        if match is None:
             raise ValueError(f"Invalid GCS path: {path}. Must start with gs://")
 
-        path_without_scheme = path[5:]
-        parts = path_without_scheme.split("/", 1)
-        bucket = parts[0]
-
+        bucket, prefix = match.groups()
         if not bucket:
             raise ValueError(f"Invalid GCS path: {path}. Bucket name is empty.")
 
-        prefix = ""
-        if len(parts) > 1 and parts[1]:
-            prefix = parts[1].rstrip("/") + "/"
+        prefix = prefix.rstrip("/") + "/" if prefix else ""
 
         return bucket, prefix
 
-    def _to_jsonl(self, data: list) -> str:
-        """Convert list of dicts to JSONL string."""
-        lines = []
-        for item in data:
-            lines.append(json.dumps(item, default=str, ensure_ascii=False))
-        return "\n".join(lines) + "\n" if lines else ""
+    def _upload(
+        self,
+        blob: storage.Blob,
+        fh: BinaryIO,
+        size: int,
+        path: Optional[Path] = None,
+    ) -> bool:
+        """
+        Upload an encoded payload, rewound at position 0.
+
+        Small payloads are only queued for flush() (returns True): their
+        uploads then overlap instead of paying one round-trip each in turn.
+        Large payloads are split into chunks uploaded in parallel (XML API
+        multipart), which needs a file on disk: `path` when the payload
+        already lives there, a temp copy otherwise.
+        """
+        if size <= BATCH_UPLOAD_MAX_SIZE:
+            # Single copy out of the spool; BytesIO(content) in flush() shares it
+            content = fh.read()
+            with self._pending_lock:
+                self._pending.append((blob, content))
+            return True
+
+        if size <= CONCURRENT_UPLOAD_THRESHOLD:
+            blob.upload_from_file(fh, size=size, content_type="application/x-ndjson")
+            return False
+
+        blob.content_type = "application/x-ndjson"
+        tmp_path = None
+        if path is None:
+            with tempfile.NamedTemporaryFile(suffix=".jsonl", delete=False) as tmp:
+                shutil.copyfileobj(fh, tmp)
+            path = tmp_path = Path(tmp.name)
+        try:
+            transfer_manager.upload_chunks_concurrently(
+                str(path),
+                blob,
+                chunk_size=UPLOAD_CHUNK_SIZE,
+                max_workers=CONCURRENT_UPLOAD_WORKERS,
+            )
+        finally:
+            if tmp_path is not None:
+                os.unlink(tmp_path)
+        return False
+
+    def flush(self) -> int:
+        """
+        Upload the queued small payloads concurrently.
+
+        Returns:
+            Number of uploads that failed.
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return 0
+
+        results = transfer_manager.upload_many(
+            [(blob, io.BytesIO(content)) for blob, content in pending],
+            upload_kwargs={"content_type": "application/x-ndjson"},
+            worker_type=transfer_manager.THREAD,
+            max_workers=CONCURRENT_UPLOAD_WORKERS,
+        )
+
+        failed = 0
+        for (blob, _), error in zip(pending, results):
+            gcs_uri = f"gs://{self._bucket_name}/{blob.name}"
+            if isinstance(error, Exception):
+                failed += 1
+                logger.error(f"Failed to upload {gcs_uri}: {error}")
+            else:
+                logger.info(f"Uploaded {gcs_uri}")
+        return failed
 
     def write(self, result: FetchResult) -> Optional[str]:
         """
@@ -84,31 +229,55 @@ class GCSWriter:
             result: FetchResult to write.
 
         Returns:
-            GCS URI of uploaded file, or None if no data.
+            GCS URI of uploaded file, or None if no data. Small payloads are
+            only uploaded on flush().
         """
-        if not result.data:
+        if result.is_empty:
             logger.warning(f"No data to write for {result.service}/{result.data_type}")
             return None
 
         blob_name = f"{self._prefix}{result.filename}"
         blob = self._bucket.blob(blob_name)
 
-        content = self._to_jsonl(result.data)
-        blob.upload_from_string(content, content_type="application/x-ndjson")
-
+        blob.chunk_size = UPLOAD_CHUNK_SIZE
         gcs_uri = f"gs://{self._bucket_name}/{blob_name}"
-        logger.info(
-            f"Uploaded {result.filename} to {gcs_uri} ({result.item_count} items)"
-        )
 
+        # Records are encoded one at a time into a file (the local copy, or a
+        # spooled temp file) and streamed from it: the full payload is never
+        # built as a single string next to the data, and streamed results are
+        # never materialized at all
         if self.keep_local and self.local_dir:
             local_path = self.local_dir / result.filename
-            self.local_dir.mkdir(parents=True, exist_ok=True)
-            local_path.write_text(content, encoding="utf-8")
-            logger.info(f"Saved local copy to {local_path}")
+            with open(local_path, "w+b", buffering=WRITE_BUFFER_SIZE) as fh:
+                size = write_jsonl(result.iter_data(), fh)
+                fh.flush()
+                fh.seek(0)
+                queued = self._upload(blob, fh, size, path=local_path) if size else None
+            if queued is None:
+                local_path.unlink()
+            else:
+                logger.info(f"Saved local copy to {local_path}")
+        else:
+            with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as fh:
+                size = write_jsonl(result.iter_data(), fh)
+                fh.seek(0)
+                queued = self._upload(blob, fh, size) if size else None
+
+        if queued is None:
+            logger.warning(f"No data to write for {result.service}/{result.data_type}")
+            return None
+
+        action = "Queued" if queued else "Uploaded"
+        logger.info(
+            f"{action} {result.filename} to {gcs_uri} ({result.item_count} items)"
+        )
 
         return gcs_uri
 
+    async def write_async(self, result: FetchResult) -> Optional[str]:
+        """Non-blocking write: the upload runs in a worker thread."""
+        return await asyncio.to_thread(self.write, result)
+
 
 class LocalWriter:
     """Handles writing fetch results to local filesystem."""
@@ -123,13 +292,6 @@ class LocalWriter:
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def _to_jsonl(self, data: list) -> str:
-        """Convert list of dicts to JSONL string."""
-        lines = []
-        for item in data:
-            lines.append(json.dumps(item, default=str, ensure_ascii=False))
-        return "\n".join(lines) + "\n" if lines else ""
-
     def write(self, result: FetchResult) -> Optional[str]:
         """
         Write fetch result to local filesystem.
@@ -140,13 +302,27 @@ class LocalWriter:
         Returns:
             Path to written file, or None if no data.
         """
-        if not result.data:
+        if result.is_empty:
             logger.warning(f"No data to write for {result.service}/{result.data_type}")
             return None
 
         output_path = self.output_dir / result.filename
-        content = self._to_jsonl(result.data)
-        output_path.write_text(content, encoding="utf-8")
+        with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as fh:
+            size = write_jsonl(result.iter_data(), fh)
+
+        # A streamed result may turn out empty only once consumed
+        if not size:
+            output_path.unlink()
+            logger.warning(f"No data to write for {result.service}/{result.data_type}")
+            return None
 
         logger.info(f"Saved {result.filename} ({result.item_count} items)")
         return str(output_path)
+
+    def flush(self) -> int:
+        """Nothing is buffered locally: kept for interface parity with GCSWriter."""
+        return 0
+
+    async def write_async(self, result: FetchResult) -> Optional[str]:
+        """Non-blocking write: the file is written in a worker thread."""
+        return await asyncio.to_thread(self.write, result)
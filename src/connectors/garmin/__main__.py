@@ -4,20 +4,43 @@ Garmin Connector Entry Point
 Main script to fetch data from Garmin Connect.
 """
 import argparse
+import asyncio
 import logging
 import sys
 import os
 from pathlib import Path
 from datetime import datetime, timedelta
 
+try:
+    from dotenv import load_dotenv
+except ImportError:  # python-dotenv optionnel
+    load_dotenv = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop optionnel, boucle asyncio standard sinon
+    uvloop = None
+
 # Add project root to path to ensure imports work when run as script
 sys.path.append(str(Path(__file__).parent.parent.parent.parent))
 
-from src.connectors.garmin.config import DEFAULT_DAYS_BACK, DEFAULT_TIMEZONE, DATA_TYPES
+from src.connectors.garmin.config import (
+    DEFAULT_DAYS_BACK,
+    DEFAULT_TIMEZONE,
+    DATA_TYPES,
+    REQUIRED_ENV_VARS,
+)
 from src.connectors.garmin.client import GarminClient
 from src.connectors.garmin.fetcher import GarminFetcher
 from src.connectors.garmin.utils import setup_logging, write_jsonl, generate_output_filename
 
+# Métriques récupérées en parallèle (le débit global reste plafonné par le fetcher)
+MAX_CONCURRENT_METRICS = 4
+# Les enregistrements passent au writer par lots : la mémoire reste bornée à
+# WRITE_QUEUE_SIZE lots quelle que soit la taille de la plage
+WRITE_BATCH_SIZE = 500
+WRITE_QUEUE_SIZE = 2 * MAX_CONCURRENT_METRICS
+
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -66,24 +89,99 @@ def parse_args() -> argparse.Namespace:
 
 def load_env(dotenv_path: Path) -> None:
     """Load environment variables from .env file."""
-    try:
-        from dotenv import load_dotenv
-        if dotenv_path.exists():
-            load_dotenv(dotenv_path)
-            logging.debug(f"Loaded .env from {dotenv_path}")
-        else:
-            logging.warning(f".env file not found at {dotenv_path}")
-    except ImportError:
+    if load_dotenv is None:
         logging.warning("python-dotenv not installed, skipping .env file loading")
+        return
+    if dotenv_path.exists():
+        load_dotenv(dotenv_path)
+        logging.debug(f"Loaded .env from {dotenv_path}")
+    else:
+        logging.warning(f".env file not found at {dotenv_path}")
 
 def validate_env_vars() -> dict:
     """Validate required environment variables."""
-    required = ["GARMIN_USERNAME", "GARMIN_PASSWORD"]
-    missing = [var for var in required if not os.getenv(var)]
+    env = {var: os.environ.get(var) for var in REQUIRED_ENV_VARS}
+    missing = [var for var, value in env.items() if not value]
     if missing:
         raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
-    return {var: os.getenv(var) for var in required}
+    return env
+
+
+async def fetch_all(
+    fetcher: GarminFetcher,
+    data_types: list,
+    start_date: datetime,
+    end_date: datetime,
+    output_dir: Path,
+    timezone: str,
+) -> None:
+    """
+    Fetch the data types concurrently and stream them through a single writer.
+
+    Each fetch task iterates its metric with iter_metric_async and hands
+    batches of WRITE_BATCH_SIZE records to the writer over a bounded queue;
+    the writer appends every batch to its data type's file. Memory stays
+    O(queue) instead of O(all records): a slow metric never holds the
+    others back, and a full queue pauses the fetchers.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_METRICS)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)
+
+    async def run_one(data_type: str) -> None:
+        batch = []
+        try:
+            async with semaphore:
+                async for item in fetcher.iter_metric_async(
+                    data_type, start_date, end_date
+                ):
+                    batch.append(item)
+                    if len(batch) >= WRITE_BATCH_SIZE:
+                        await queue.put((data_type, batch))
+                        batch = []
+        except Exception as e:
+            logging.error(f"Failed to fetch {data_type}: {e}")
+        if batch:
+            await queue.put((data_type, batch))
+        # Fin du flux de cette métrique
+        await queue.put((data_type, None))
+
+    async def write_results() -> None:
+        # Fichier et nombre d'items écrits par data type (fichier créé au premier lot)
+        outputs = {}
+        remaining = len(data_types)
+        while remaining:
+            data_type, batch = await queue.get()
+            if batch is None:
+                remaining -= 1
+                output_file, count = outputs.get(data_type, (None, 0))
+                if count:
+                    logging.info(f"📁 Dump saved to: {output_file} ({count} items)")
+                continue
+            try:
+                output_file, count = outputs.get(data_type, (None, 0))
+                append = output_file is not None
+                if not append:
+                    output_file = generate_output_filename(
+                        output_dir, data_type, timezone
+                    )
+                    outputs[data_type] = (output_file, count)
+                await asyncio.to_thread(write_jsonl, batch, output_file, append)
+                outputs[data_type] = (output_file, count + len(batch))
+            except Exception as e:
+                logging.error(f"Failed to write {data_type}: {e}")
 
+    async with asyncio.TaskGroup() as tasks:
+        tasks.create_task(write_results())
+        for data_type in data_types:
+            tasks.create_task(run_one(data_type))
+
+
+def run_async(coro):
+    """Run a coroutine to completion, on a uvloop event loop when available."""
+    if uvloop is None:
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
 
 
 def main():
@@ -111,18 +209,17 @@ def main():
             f"Fetching Garmin data from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
         )
         
-        # Fetch loop
-        for data_type in args.data_types:
-            try:
-                data = fetcher.fetch_metric(data_type, start_date, end_date)
-                if data:
-                    output_file = generate_output_filename(
-                        args.output_dir, data_type, args.timezone
-                    )
-                    write_jsonl(data, output_file)
-            except Exception as e:
-                logging.error(f"Failed to fetch {data_type}: {e}")
-                continue
+        # Fetch loop: data types are independent, they run concurrently
+        run_async(
+            fetch_all(
+                fetcher,
+                args.data_types,
+                start_date,
+                end_date,
+                args.output_dir,
+                args.timezone,
+            )
+        )
                 
         logging.info("✅ Script completed successfully")
         
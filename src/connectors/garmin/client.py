@@ -13,6 +13,19 @@ except ImportError:
     # This will be handled by the main entry point check
     pass
 
+# Répertoire des tokens OAuth garth (réutilisés d'un run à l'autre)
+DEFAULT_TOKENSTORE = "~/.garminconnect"
+
+# Pool HTTP de la session garth : assez de connexions keep-alive pour les
+# requêtes concurrentes du fetcher, avec retry/backoff sur les 5xx. Les 429
+# ne sont pas rejoués ici : ils remontent au RateLimiter du fetcher, qui
+# ralentit tout le débit et honore le Retry-After
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+HTTP_RETRIES = 5
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUSES = (500, 502, 503, 504)
+
 class GarminClient:
     """Wrapper for Garmin Connect client."""
     
@@ -21,14 +34,50 @@ class GarminClient:
         self.password = env_vars.get("GARMIN_PASSWORD")
         self.client = None
         
+    def _new_client(self) -> Any:
+        """Garmin client whose garth session uses the tuned pool and retry policy."""
+        client = Garmin(self.username, self.password)
+        # configure() remounts the HTTPS adapter on garth's own session, which
+        # keeps its headers and OAuth handling
+        client.garth.configure(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            retries=HTTP_RETRIES,
+            backoff_factor=HTTP_BACKOFF_FACTOR,
+            status_forcelist=HTTP_RETRY_STATUSES,
+        )
+        return client
+
+    def _dump_tokens(self, tokenstore: str) -> None:
+        """Persist the garth tokens; an unwritable token store must not break login."""
+        try:
+            self.client.garth.dump(tokenstore)
+        except OSError as e:
+            logging.debug(f"Could not save Garmin tokens to {tokenstore}: {e}")
+
     def authenticate(self) -> Any:
         """Authenticate to Garmin Connect."""
         if not self.username or not self.password:
             raise ValueError("Missing Garmin credentials")
             
+        tokenstore = os.path.expanduser(os.getenv("GARMINTOKENS", DEFAULT_TOKENSTORE))
+
         try:
-            self.client = Garmin(self.username, self.password)
+            self.client = self._new_client()
+            if os.path.isdir(tokenstore):
+                try:
+                    self.client.login(tokenstore)
+                    # Le token OAuth2 a pu être rafraîchi pendant le login :
+                    # on le persiste pour que le prochain run n'ait pas à le refaire
+                    self._dump_tokens(tokenstore)
+                    logging.info("✅ Authenticated to Garmin Connect (stored tokens)")
+                    return self.client
+                except Exception as e:
+                    logging.info(f"Stored Garmin tokens unusable ({e}), logging in with credentials")
+                    self.client = self._new_client()
+
             self.client.login()
+            self._dump_tokens(tokenstore)
             logging.info("✅ Authenticated to Garmin Connect")
             return self.client
         except Exception as e:
@@ -5,21 +5,55 @@ Defines the metrics to fetch and their corresponding API methods.
 Now loads configuration from metrics.yaml.
 """
 import yaml
+from dataclasses import dataclass
 from pathlib import Path
 import logging
 
+try:
+    # Parser C de libyaml, bien plus rapide que le parser pur Python
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Load metrics configuration from YAML file
 metrics_file = Path(__file__).parent / "metrics.yaml"
 
 try:
     with open(metrics_file, "r") as f:
-        METRICS_CONFIG = yaml.safe_load(f)
+        METRICS_CONFIG = yaml.load(f, Loader=SafeLoader)
 except Exception as e:
     logging.error(f"Failed to load metrics.yaml: {e}")
     # Fallback to empty or raise error? Raising error is safer.
     raise RuntimeError(f"Could not load metrics configuration: {e}")
 
+# Taille de chunk par défaut des métriques "range" : 52 semaines
+DEFAULT_CHUNK_DAYS = 364
+
+
+@dataclass(frozen=True, slots=True)
+class MetricSpec:
+    """Fetch settings of one metric, resolved once from metrics.yaml."""
+
+    method_name: str
+    fetch_type: str
+    chunk_days: int = DEFAULT_CHUNK_DAYS
+
+
+# Specs des métriques (les entrées sans method/type, comme "ingestion", sont ignorées)
+METRICS = {
+    name: MetricSpec(
+        method_name=cfg["method"],
+        fetch_type=cfg["type"],
+        chunk_days=cfg.get("chunk_days", DEFAULT_CHUNK_DAYS),
+    )
+    for name, cfg in METRICS_CONFIG.items()
+    if isinstance(cfg, dict) and "method" in cfg and "type" in cfg
+}
+
 DEFAULT_DAYS_BACK = 30
+# Un jour plus vieux que IMMUTABLE_AFTER_DAYS (avant hier) est synchronisé et
+# ne change plus : seuil commun à tous les caches de réponses journalières
+IMMUTABLE_AFTER_DAYS = 1
 DEFAULT_TIMEZONE = "Europe/Paris"
 REQUIRED_ENV_VARS = ["GARMIN_USERNAME", "GARMIN_PASSWORD"]
 DATA_TYPES = [k for k in METRICS_CONFIG.keys() if k != "ingestion"]
@@ -3,19 +3,170 @@ Garmin Generic Fetcher
 ----------------------
 Core logic for fetching data from Garmin Connect using a configuration-driven approach.
 """
+import asyncio
+import hashlib
+import json
 import logging
-import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Callable
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import (
+    List, Dict, Any, Optional, AsyncIterator, Awaitable, Callable, Iterator, Tuple
+)
 
-from .config import METRICS_CONFIG
-from .utils import flatten_nested_arrays
+from .config import DEFAULT_CHUNK_DAYS, METRICS
+from .utils import RateLimiter, closed_day_cutoff, flatten_nested_arrays
+
+# Requêtes Garmin en vol simultanément (par métrique)
+MAX_CONCURRENT_REQUESTS = 8
+# Débit global de départ (remplace le sleep de 0.3s entre deux jours) : le
+# limiteur l'ajuste ensuite entre REQUESTS_PER_SECOND / 8 et MAX_REQUESTS_PER_SECOND
+REQUESTS_PER_SECOND = 3
+MAX_REQUESTS_PER_SECOND = 10
+# Requêtes pouvant partir d'un coup quand le débit n'a pas été consommé
+REQUEST_BURST = 6
+# Nouvelles tentatives après un 429 (attente Retry-After ou backoff exponentiel)
+THROTTLE_RETRIES = 3
+THROTTLE_BACKOFF_FACTOR = 2.0
+# Réponses journalières des jours clos (voir closed_day_cutoff) gardées sur
+# disque, hors de l'arbre des sources : GARMIN_CACHE_DIR si défini, sinon le
+# cache utilisateur ($XDG_CACHE_HOME ou ~/.cache)
+DAILY_CACHE_DIR = Path(
+    os.getenv("GARMIN_CACHE_DIR")
+    or Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "ela-dp" / "garmin"
+).expanduser()
+# Taille de page de la liste d'activités (comme l'interface web Garmin)
+ACTIVITY_PAGE_SIZE = 20
+# Distingue "absent du cache" d'une réponse vide mise en cache
+_CACHE_MISS = object()
+
+def _throttling(error: BaseException) -> Tuple[bool, Optional[float]]:
+    """
+    Whether a client error is a Garmin rate limit, and its Retry-After.
+
+    The 429 surfaces as a garminconnect TooManyRequests error or a
+    garth/requests HTTP error carrying the response; GarminClient keeps 429
+    out of the session's retries so it reaches the limiter on the first
+    hit. A requests RetryError naming 429 (a session configured elsewhere)
+    is recognised too.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        response = getattr(error, "response", None)
+        if response is None:
+            response = getattr(getattr(error, "error", None), "response", None)
+        if response is not None and getattr(response, "status_code", None) == 429:
+            retry_after = response.headers.get("Retry-After", "")
+            try:
+                return True, float(retry_after)
+            except ValueError:
+                return True, None
+        name = type(error).__name__
+        if "TooManyRequests" in name or (name == "RetryError" and "429" in str(error)):
+            return True, None
+        error = error.__cause__ or getattr(error, "error", None)
+    return False, None
+
+def _date_chunks(
+    start_date: datetime, end_date: datetime, chunk_days: int
+) -> List[Tuple[str, str]]:
+    """
+    (start, end) ISO date pairs covering the range, chunk_days apart.
+
+    Each chunk ends chunk_days after it starts (or at end_date) and the
+    next one starts the day after. Built once, without strftime.
+    """
+    chunks = []
+    current = start_date.date()
+    last = end_date.date()
+    step = timedelta(days=chunk_days)
+    while current <= last:
+        chunk_end = min(current + step, last)
+        chunks.append((current.isoformat(), chunk_end.isoformat()))
+        current = chunk_end + timedelta(days=1)
+    return chunks
+
+def _normalize_daily(
+    data: Any, date_str: str, metric_name: str, out: List[Dict[str, Any]]
+) -> None:
+    """
+    Tag one day's response with its date and data type and append it to out.
+
+    Lists keep only their dict items; each is tagged with one dict.update
+    (C-level) instead of two item assignments.
+    """
+    tag = {"date": date_str, "data_type": metric_name}
+    if isinstance(data, list):
+        items = [item for item in data if isinstance(item, dict)]
+        for item in items:
+            item.update(tag)
+        out.extend(items)
+    elif isinstance(data, dict):
+        data.update(tag)
+        out.append(data)
+    else:
+        out.append({"date": date_str, "data": data, "data_type": metric_name})
+
+class _ActivityListing:
+    """
+    Activity list of one date range, shared by the per-activity metrics.
+
+    Pages are appended as they arrive; readers wait on `changed`, which is
+    set and replaced after every page and once the listing is finished.
+    """
+
+    __slots__ = ("loop", "pages", "changed", "done", "error", "task")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.pages: List[Any] = []
+        self.changed = asyncio.Event()
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.task: Optional[asyncio.Task] = None
+
+    def notify(self) -> None:
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
 
 class GarminFetcher:
     """Generic fetcher for Garmin Connect data."""
     
-    def __init__(self, client: Any):
+    def __init__(self, client: Any, cache_dir: Optional[Path] = DAILY_CACHE_DIR):
         self.client = client
+        self._limiter = RateLimiter(
+            REQUESTS_PER_SECOND, max_rate=MAX_REQUESTS_PER_SECOND, burst=REQUEST_BURST
+        )
+        # Cache des jours clos : mémoire (process) + disque (entre runs),
+        # désactivé avec cache_dir=None (quand la session HTTP a déjà le sien)
+        self._cache_dir = cache_dir
+        self._daily_cache: Dict[str, Any] = {}
+        self._cache_owner = str(getattr(client, "username", "") or "")
+        # Liste d'activités par (start, end) : téléchargée une fois pour
+        # activity_details et toutes les métriques activity_subdata
+        self._activity_listings: Dict[Tuple[str, str], _ActivityListing] = {}
+        # Méthodes client résolues une fois par métrique (absentes si le client
+        # ne les expose pas)
+        self._method_cache = {
+            name: getattr(client, spec.method_name)
+            for name, spec in METRICS.items()
+            if hasattr(client, spec.method_name)
+        }
+        # Handler par fetch_type : (method, metric_name, start, end) -> async iterator
+        self._dispatch: Dict[str, Callable[..., AsyncIterator[Dict[str, Any]]]] = {
+            "daily": self._iter_daily,
+            "range": self._iter_range,
+            "simple": self._iter_simple,
+            "activity_detail": lambda method, name, start, end: (
+                self._iter_activity_details(self.client, start, end)
+            ),
+            "activity_subdata": lambda method, name, start, end: (
+                self._iter_activity_subdata(
+                    self.client, name, METRICS[name].method_name, start, end
+                )
+            ),
+        }
         
     def fetch_metric(
         self, 
@@ -27,185 +178,335 @@ class GarminFetcher:
         Fetch a specific metric based on its configuration.
         
         Args:
-            metric_name: Name of the metric (must be in METRICS_CONFIG)
+            metric_name: Name of the metric (must be in METRICS)
             start_date: Start date for fetching
             end_date: End date for fetching
             
         Returns:
             List of data dictionaries
         """
-        if metric_name not in METRICS_CONFIG:
+        return asyncio.run(self.fetch_metric_async(metric_name, start_date, end_date))
+
+    def iter_metric(
+        self,
+        metric_name: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Streaming variant of fetch_metric: yield items as they are parsed.
+
+        The event loop only runs while the next item is awaited, so a
+        caller writing each item to disk keeps one day/chunk in memory
+        instead of the whole range.
+        """
+        items = self.iter_metric_async(metric_name, start_date, end_date)
+        with asyncio.Runner() as runner:
+            try:
+                while True:
+                    try:
+                        yield runner.run(anext(items))
+                    except StopAsyncIteration:
+                        return
+            finally:
+                runner.run(items.aclose())
+
+    async def fetch_metric_async(
+        self,
+        metric_name: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of fetch_metric, for fetching several metrics in one loop.
+
+        Daily and per-activity metrics fan their requests out concurrently;
+        range and simple metrics run in a worker thread.
+        """
+        return [
+            item async for item in self.iter_metric_async(metric_name, start_date, end_date)
+        ]
+
+    async def iter_metric_async(
+        self,
+        metric_name: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the items of a metric as each day/chunk/activity is parsed."""
+        spec = METRICS.get(metric_name)
+        if spec is None:
             logging.warning(f"Unknown metric: {metric_name}")
-            return []
-            
-        config = METRICS_CONFIG[metric_name]
-        method_name = config["method"]
-        fetch_type = config["type"]
+            return
         
         # Check if client has the method
-        if not hasattr(self.client, method_name):
-            logging.error(f"Client missing method: {method_name}")
-            return []
-            
-        method = getattr(self.client, method_name)
+        method = self._method_cache.get(metric_name)
+        if method is None:
+            logging.error(f"Client missing method: {spec.method_name}")
+            return
         
         logging.info(f"📊 Fetching {metric_name} data...")
         
-        if fetch_type == "daily":
-            return self._fetch_daily(method, metric_name, start_date, end_date)
-        elif fetch_type == "range":
-            return self._fetch_range(method, metric_name, start_date, end_date)
-        elif fetch_type == "simple":
-            return self._fetch_simple(method, metric_name)
-        elif fetch_type == "activity_detail":
-            return self._fetch_activity_details(self.client, start_date, end_date)
-        elif fetch_type == "activity_subdata":
-            return self._fetch_activity_subdata(self.client, metric_name, method_name, start_date, end_date)
-        else:
-            logging.warning(f"Unknown fetch type {fetch_type} for {metric_name}")
-            return []
+        handler = self._dispatch.get(spec.fetch_type)
+        if handler is None:
+            logging.warning(f"Unknown fetch type {spec.fetch_type} for {metric_name}")
+            return
+        async for item in handler(method, metric_name, start_date, end_date):
+            yield item
 
-    def _fetch_daily(
-        self, 
-        method: Callable, 
-        metric_name: str, 
-        start_date: datetime, 
+    async def _call(
+        self, semaphore: asyncio.Semaphore, method: Callable, *args, **kwargs
+    ) -> Any:
+        """
+        Run one blocking client call in a worker thread, bounded and paced.
+
+        Rate-limit errors slow the shared limiter down (honouring Retry-After)
+        and are retried with exponential backoff; successes speed it back up.
+        """
+        for attempt in range(THROTTLE_RETRIES + 1):
+            async with semaphore:
+                await self._limiter.acquire()
+                try:
+                    result = await asyncio.to_thread(method, *args, **kwargs)
+                except Exception as e:
+                    throttled, retry_after = _throttling(e)
+                    if not throttled or attempt == THROTTLE_RETRIES:
+                        raise
+                    pause = retry_after or THROTTLE_BACKOFF_FACTOR * 2 ** attempt
+                    self._limiter.throttle(pause)
+                    logging.warning(
+                        f"Garmin rate limit hit, retrying in {pause:.1f}s "
+                        f"at {self._limiter.rate:.2f} req/s"
+                    )
+                    continue
+            self._limiter.recover()
+            return result
+
+    def _daily_cache_key(self, metric_name: str, date_str: str) -> str:
+        """Cache key of one day of a metric for the logged-in account."""
+        raw = f"{metric_name}|{date_str}|{self._cache_owner}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _read_daily_cache(self, key: str) -> Any:
+        """Cached response for a closed day, or _CACHE_MISS."""
+        if key in self._daily_cache:
+            return self._daily_cache[key]
+        if self._cache_dir is None:
+            return _CACHE_MISS
+        try:
+            with open(self._cache_dir / f"{key}.json", "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return _CACHE_MISS
+        self._daily_cache[key] = data
+        return data
+
+    def _write_daily_cache(self, key: str, data: Any) -> None:
+        """Keep a closed day's response in memory and on disk (atomic write)."""
+        self._daily_cache[key] = data
+        if self._cache_dir is None:
+            return
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._cache_dir / f"{key}.json"
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, default=str)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logging.debug(f"Could not cache {key}: {e}")
+
+    async def _iter_daily(
+        self,
+        method: Callable,
+        metric_name: str,
+        start_date: datetime,
         end_date: datetime
-    ) -> List[Dict[str, Any]]:
-        """Fetch data day by day."""
-        results = []
-        current_date = start_date
-        
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch every day of the range concurrently, yielding day by day.
+
+        The garminconnect client is blocking: each call runs in a worker
+        thread, at most MAX_CONCURRENT_REQUESTS at once and paced by the
+        shared rate limiter. Items keep the chronological order: a day is
+        yielded as soon as it and every earlier day are done.
+
+        Closed days (before closed_day_cutoff) are served from the response
+        cache when present and never hit the network again, unless the
+        cache is disabled with cache_dir=None.
+        """
+        # One ISO string per calendar day, built from ordinals (no strftime)
+        dates = [
+            date.fromordinal(ordinal).isoformat()
+            for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1)
+        ]
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # ISO dates compare as strings; "" disables the cache
+        closed_before = closed_day_cutoff() if self._cache_dir is not None else ""
+
+        def normalize_day(date_str: str, data: Any) -> List[Dict[str, Any]]:
+            day_results = []
+            if not data:
+                return day_results
             try:
-                data = method(date_str)
-                if data:
-                    # Transform nested arrays first
-                    data = flatten_nested_arrays(data, path=f"{metric_name}.{date_str}")
-                    
-                    # Normalize data structure
-                    if isinstance(data, list):
-                        for item in data:
-                            if isinstance(item, dict):
-                                item["date"] = date_str
-                                item["data_type"] = metric_name
-                                results.append(item)
-                    elif isinstance(data, dict):
-                        data["date"] = date_str
-                        data["data_type"] = metric_name
-                        results.append(data)
-                    else:
-                        results.append({
-                            "date": date_str, 
-                            "data": data, 
-                            "data_type": metric_name
-                        })
-                
-                time.sleep(0.3) # Rate limiting
-                
+                # Transform nested arrays first
+                data = flatten_nested_arrays(data, path_factory=lambda: f"{metric_name}.{date_str}")
+
+                # Normalize data structure
+                _normalize_daily(data, date_str, metric_name, day_results)
             except Exception as e:
                 logging.warning(f"Error fetching {metric_name} for {date_str}: {e}")
-                
-            current_date += timedelta(days=1)
-            
-        logging.info(f"Fetched {metric_name} for {len(results)} entries")
-        return results
+            return day_results
+
+        async def fetch_day(date_str: str) -> List[Dict[str, Any]]:
+            cache_key = None
+            if date_str < closed_before:
+                cache_key = self._daily_cache_key(metric_name, date_str)
+                cached = self._read_daily_cache(cache_key)
+                if cached is not _CACHE_MISS:
+                    return normalize_day(date_str, cached)
+            try:
+                data = await self._call(semaphore, method, date_str)
+            except Exception as e:
+                logging.warning(f"Error fetching {metric_name} for {date_str}: {e}")
+                return []
+            if cache_key is not None:
+                self._write_daily_cache(cache_key, data)
+            # Normalized as soon as it arrives, while other days are in flight
+            return normalize_day(date_str, data)
+
+        tasks = [asyncio.ensure_future(fetch_day(date_str)) for date_str in dates]
+        count = 0
+        try:
+            for task in tasks:
+                for item in await task:
+                    count += 1
+                    yield item
+        finally:
+            # Consumer stopped early: drop the days still in flight
+            for task in tasks:
+                task.cancel()
 
-    def _fetch_range(
+        logging.info(f"Fetched {metric_name} for {count} entries")
+
+    async def _iter_range(
         self, 
         method: Callable, 
         metric_name: str, 
         start_date: datetime, 
         end_date: datetime
-    ) -> List[Dict[str, Any]]:
-        """Fetch data using a date range, chunking if necessary."""
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch data using a date range, chunking if necessary.
+
+        Chunks are requested one after the other, paced by the shared rate
+        limiter (no fixed sleep between chunks). As soon as a chunk has
+        arrived the next one is prefetched, so its network round trip
+        overlaps the normalization and consumption of the current chunk.
+        """
+        count = 0
+        prefetch: Optional[asyncio.Future] = None
         try:
-            results = []
+            semaphore = asyncio.Semaphore(1)
             
             # Chunking logic: split into chunks to avoid API limits
             # Some endpoints limit to 1 year or less (e.g. bodyBattery, enduranceScore)
-            config = METRICS_CONFIG.get(metric_name, {})
-            CHUNK_SIZE_DAYS = config.get("chunk_days", 364) # Default to 52 weeks
+            spec = METRICS.get(metric_name)
+            chunk_days = spec.chunk_days if spec is not None else DEFAULT_CHUNK_DAYS
+            method_name = spec.method_name if spec is not None else metric_name
             
-            current_start = start_date
-            while current_start <= end_date:
-                current_end = min(current_start + timedelta(days=CHUNK_SIZE_DAYS), end_date)
-                
-                start_str = current_start.strftime("%Y-%m-%d")
-                end_str = current_end.strftime("%Y-%m-%d")
-                
-                logging.info(f"  Fetching chunk: {start_str} to {end_str}")
-                
-                chunk_data = None
+            def request_chunk(chunk: Tuple[str, str]) -> asyncio.Future:
+                logging.info(f"  Fetching chunk: {chunk[0]} to {chunk[1]}")
+                return asyncio.ensure_future(self._call(semaphore, method, *chunk))
+
+            chunks = _date_chunks(start_date, end_date, chunk_days)
+            if chunks:
+                prefetch = request_chunk(chunks[0])
+            for position in range(len(chunks)):
+                chunked = True
                 # Some methods might not take args if they are "max metrics" fallback
                 try:
-                    chunk_data = method(start_str, end_str)
+                    chunk_data = await prefetch
+                    prefetch = None
+                    if position + 1 < len(chunks):
+                        prefetch = request_chunk(chunks[position + 1])
                 except TypeError:
                     # Fallback for methods that might have changed signature or behave differently
                     # If method doesn't accept args, we can't chunk it effectively in this loop
-                    # so we just call it once and break
-                    logging.debug(f"Method {method.__name__} rejected range args, trying without")
-                    chunk_data = method()
-                    current_start = end_date + timedelta(days=1) # Force exit loop
+                    # so we just call it once and stop
+                    logging.debug(f"Method {method_name} rejected range args, trying without")
+                    chunk_data = await self._call(semaphore, method)
+                    chunked = False
     
                 if chunk_data:
-                    # Special handling for weight: extract and flatten weight data BEFORE generic flattening
-                    if metric_name == "weight" and isinstance(chunk_data, dict):
-                        # Check if we have dailyWeightSummaries at the top level
-                        if "dailyWeightSummaries" in chunk_data and isinstance(chunk_data["dailyWeightSummaries"], list):
-                            all_weight_entries = []
-                            for daily_summary in chunk_data["dailyWeightSummaries"]:
-                                if isinstance(daily_summary, dict) and "allWeightMetrics" in daily_summary:
-                                    summary_date = daily_summary.get("summaryDate")
-                                    for entry in daily_summary["allWeightMetrics"]:
-                                        if isinstance(entry, dict):
-                                            # Add summaryDate if not present
-                                            if summary_date and "summaryDate" not in entry:
-                                                entry["summaryDate"] = summary_date
-                                            all_weight_entries.append(entry)
-                            chunk_data = all_weight_entries
-                            logging.info(f"Flattened weight data: {len(chunk_data)} entries")
-                        # Fallback: check if allWeightMetrics is directly at the top level
-                        elif "allWeightMetrics" in chunk_data:
-                            summary_date = chunk_data.get("summaryDate")
-                            chunk_data = chunk_data["allWeightMetrics"]
-                            if summary_date and isinstance(chunk_data, list):
-                                for entry in chunk_data:
-                                    if isinstance(entry, dict) and "summaryDate" not in entry:
-                                        entry["summaryDate"] = summary_date
-                            logging.info(f"Flattened weight data: {len(chunk_data)} entries")
-                    
-                    # Special handling for body_composition: flatten dateWeightList if present
-                    elif metric_name == "body_composition" and isinstance(chunk_data, dict) and "dateWeightList" in chunk_data:
-                        chunk_data = chunk_data["dateWeightList"]
-                        logging.info(f"Flattened body_composition data: {len(chunk_data)} entries")
-                    else:
-                        # Transform nested arrays for other metrics
-                        chunk_data = flatten_nested_arrays(chunk_data, path=metric_name)
-                        
-                    if isinstance(chunk_data, list):
-                        for item in chunk_data:
-                            if isinstance(item, dict):
-                                item["data_type"] = metric_name
-                            results.append(item)
-                    elif isinstance(chunk_data, dict):
-                        chunk_data["data_type"] = metric_name
-                        results.append(chunk_data)
-                    else:
-                        results.append({"data": chunk_data, "data_type": metric_name})
-                
-                # Move to next chunk
-                current_start = current_end + timedelta(days=1)
-                if current_start <= end_date:
-                    time.sleep(1) # Sleep between chunks
+                    chunk_items = []
+                    self._normalize_range_chunk(chunk_data, metric_name, chunk_items)
+                    count += len(chunk_items)
+                    for item in chunk_items:
+                        yield item
+
+                if not chunked:
+                    break
                 
-            logging.info(f"Fetched {metric_name}: {len(results)} items")
-            return results
+            logging.info(f"Fetched {metric_name}: {count} items")
             
         except Exception as e:
             logging.error(f"Error fetching {metric_name} (range): {e}")
-            return []
+        finally:
+            # Consumer stopped early: drop the chunk in flight
+            if prefetch is not None:
+                prefetch.cancel()
+
+    @staticmethod
+    def _normalize_range_chunk(
+        chunk_data: Any, metric_name: str, results: List[Dict[str, Any]]
+    ) -> None:
+        """Flatten one range chunk and append its items, tagged, to results."""
+        # Special handling for weight: extract and flatten weight data BEFORE generic flattening
+        if metric_name == "weight" and isinstance(chunk_data, dict):
+            # Check if we have dailyWeightSummaries at the top level
+            if "dailyWeightSummaries" in chunk_data and isinstance(chunk_data["dailyWeightSummaries"], list):
+                all_weight_entries = []
+                for daily_summary in chunk_data["dailyWeightSummaries"]:
+                    if isinstance(daily_summary, dict) and "allWeightMetrics" in daily_summary:
+                        summary_date = daily_summary.get("summaryDate")
+                        for entry in daily_summary["allWeightMetrics"]:
+                            if isinstance(entry, dict):
+                                # Add summaryDate if not present
+                                if summary_date and "summaryDate" not in entry:
+                                    entry["summaryDate"] = summary_date
+                                all_weight_entries.append(entry)
+                chunk_data = all_weight_entries
+                logging.info(f"Flattened weight data: {len(chunk_data)} entries")
+            # Fallback: check if allWeightMetrics is directly at the top level
+            elif "allWeightMetrics" in chunk_data:
+                summary_date = chunk_data.get("summaryDate")
+                chunk_data = chunk_data["allWeightMetrics"]
+                if summary_date and isinstance(chunk_data, list):
+                    for entry in chunk_data:
+                        if isinstance(entry, dict) and "summaryDate" not in entry:
+                            entry["summaryDate"] = summary_date
+                logging.info(f"Flattened weight data: {len(chunk_data)} entries")
+
+        # Special handling for body_composition: flatten dateWeightList if present
+        elif metric_name == "body_composition" and isinstance(chunk_data, dict) and "dateWeightList" in chunk_data:
+            chunk_data = chunk_data["dateWeightList"]
+            logging.info(f"Flattened body_composition data: {len(chunk_data)} entries")
+        else:
+            # Transform nested arrays for other metrics
+            chunk_data = flatten_nested_arrays(chunk_data, path=metric_name)
+
+        if isinstance(chunk_data, list):
+            for item in chunk_data:
+                if isinstance(item, dict):
+                    item["data_type"] = metric_name
+                results.append(item)
+        elif isinstance(chunk_data, dict):
+            chunk_data["data_type"] = metric_name
+            results.append(chunk_data)
+        else:
+            results.append({"data": chunk_data, "data_type": metric_name})
 
     def _fetch_simple(self, method: Callable, metric_name: str) -> List[Dict[str, Any]]:
         """Fetch data without parameters."""
@@ -237,133 +538,351 @@ class GarminFetcher:
             logging.error(f"Error fetching {metric_name} (simple): {e}")
             return []
 
-    def _fetch_activity_details(
-        self, 
-        client: Any, 
-        start_date: datetime, 
+    async def _iter_simple(
+        self,
+        method: Callable,
+        metric_name: str,
+        start_date: datetime,
         end_date: datetime
-    ) -> List[Dict[str, Any]]:
-        """Special handling for activity details (requires 2 steps)."""
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the items of a parameterless metric (one call, worker thread)."""
+        for item in await asyncio.to_thread(self._fetch_simple, method, metric_name):
+            yield item
+
+    async def _iter_activity_pages(
+        self,
+        client: Any,
+        semaphore: asyncio.Semaphore,
+        start_date: datetime,
+        end_date: datetime
+    ):
+        """
+        Yield the activities of the range one page at a time, memoized.
+
+        The first metric asking for a range starts its listing in a task;
+        the other per-activity metrics of the run read the same pages, as
+        they arrive or from memory, instead of downloading the list again.
+        Asking for another range drops the finished listings. A failed
+        listing is not kept, so the next metric requests it again.
+        """
+        key = (start_date.date().isoformat(), end_date.date().isoformat())
+        loop = asyncio.get_running_loop()
+
+        listing = self._activity_listings.get(key)
+        if listing is None or (not listing.done and listing.loop is not loop):
+            # New range (or listing left over by a closed event loop)
+            self._activity_listings = {
+                other_key: other
+                for other_key, other in self._activity_listings.items()
+                if not other.done and other.loop is loop
+            }
+            listing = _ActivityListing(loop)
+            self._activity_listings[key] = listing
+            listing.task = loop.create_task(
+                self._run_activity_listing(client, semaphore, key, listing)
+            )
+
+        index = 0
+        while True:
+            while index < len(listing.pages):
+                yield listing.pages[index]
+                index += 1
+            if listing.done:
+                if listing.error is not None:
+                    raise listing.error
+                return
+            await listing.changed.wait()
+
+    async def _run_activity_listing(
+        self,
+        client: Any,
+        semaphore: asyncio.Semaphore,
+        key: Tuple[str, str],
+        listing: _ActivityListing
+    ) -> None:
+        """Fill a shared listing from _request_activity_pages."""
         try:
-            # 1. Get activities
-            activities = client.get_activities_by_date(
-                start_date.strftime("%Y-%m-%d"), 
-                end_date.strftime("%Y-%m-%d")
+            async for page in self._request_activity_pages(client, semaphore, *key):
+                listing.pages.append(page)
+                listing.notify()
+        except BaseException as e:
+            listing.error = e
+            if self._activity_listings.get(key) is listing:
+                del self._activity_listings[key]
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            listing.done = True
+            listing.notify()
+
+    async def _request_activity_pages(
+        self,
+        client: Any,
+        semaphore: asyncio.Semaphore,
+        start_str: str,
+        end_str: str
+    ):
+        """
+        Yield the activities of the range one page at a time.
+
+        Pages are requested the way get_activities_by_date does internally,
+        so callers can start working on the first page while the next ones
+        are still loading. A short page ends the listing (no trailing empty
+        request). Clients without the paged endpoint get a single call.
+        """
+        url = getattr(client, "garmin_connect_activities", None)
+        if not isinstance(url, str):
+            yield await self._call(
+                semaphore, client.get_activities_by_date, start_str, end_str
             )
-            
-            results = []
-            for activity in activities:
-                activity_id = activity.get("activityId")
-                if not activity_id:
+            return
+
+        start = 0
+        while True:
+            params = {
+                "startDate": start_str,
+                "endDate": end_str,
+                "start": str(start),
+                "limit": str(ACTIVITY_PAGE_SIZE),
+            }
+            page = await self._call(semaphore, client.connectapi, url, params=params)
+            if not isinstance(page, list) or not page:
+                return
+            yield page
+            if len(page) < ACTIVITY_PAGE_SIZE:
+                return
+            start += ACTIVITY_PAGE_SIZE
+
+    async def _pipeline_activities(
+        self,
+        client: Any,
+        semaphore: asyncio.Semaphore,
+        start_date: datetime,
+        end_date: datetime,
+        fetch_one: Callable[[Any], Awaitable[Any]],
+        to_item: Callable[[Dict[str, Any]], Any] = lambda activity: activity,
+    ) -> AsyncIterator[Tuple[Any, Any]]:
+        """
+        List the activities and fetch per-activity data as a pipeline.
+
+        A producer pages through the activity list and queues every
+        activity (converted by to_item) as soon as its page arrives;
+        MAX_CONCURRENT_REQUESTS workers call fetch_one on them meanwhile
+        and post each outcome to a completion queue, drained here as
+        completions arrive.
+
+        Yields:
+            (item, result) pairs in activity list order, each one as soon
+            as it and every earlier activity are done; result is the
+            exception raised by fetch_one when it failed.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        completions: asyncio.Queue = asyncio.Queue()
+        listing_error: List[BaseException] = []
+
+        async def produce() -> None:
+            index = 0
+            try:
+                async for page in self._iter_activity_pages(
+                    client, semaphore, start_date, end_date
+                ):
+                    for activity in page or []:
+                        if activity.get("activityId"):
+                            await queue.put((index, to_item(activity)))
+                            index += 1
+            except Exception as e:
+                listing_error.append(e)
+            finally:
+                for _ in range(MAX_CONCURRENT_REQUESTS):
+                    await queue.put(None)
+
+        async def consume() -> None:
+            try:
+                while (entry := await queue.get()) is not None:
+                    index, item = entry
+                    try:
+                        result = await fetch_one(item)
+                    except Exception as e:
+                        result = e
+                    await completions.put((index, item, result))
+            finally:
+                await completions.put(None)
+
+        tasks = [asyncio.ensure_future(produce())]
+        tasks.extend(asyncio.ensure_future(consume()) for _ in range(MAX_CONCURRENT_REQUESTS))
+        try:
+            # Completions arrive in any order: hold them until their turn
+            pending: Dict[int, Tuple[Any, Any]] = {}
+            next_index = 0
+            running = MAX_CONCURRENT_REQUESTS
+            while running:
+                completion = await completions.get()
+                if completion is None:
+                    running -= 1
                     continue
-                    
-                try:
-                    details = client.get_activity_details(activity_id, maxchart=2000, maxpoly=4000)
-                    
-                    # Transform nested arrays in activity and details
-                    clean_activity = flatten_nested_arrays(activity, path=f"activity_{activity_id}")
-                    clean_details = flatten_nested_arrays(details, path=f"details_{activity_id}")
-                    
-                    enriched = {
-                        **clean_activity,
-                        "detailed_data": clean_details,
-                        "data_type": "activity_details"
-                    }
-                    results.append(enriched)
-                    time.sleep(0.5)
-                except Exception as e:
-                    logging.warning(f"Failed details for {activity_id}: {e}")
-                    
-            logging.info(f"Fetched details for {len(results)} activities")
-            return results
+                index, item, result = completion
+                pending[index] = (item, result)
+                while next_index in pending:
+                    yield pending.pop(next_index)
+                    next_index += 1
+        finally:
+            # Consumer stopped early: drop the listing and fetches in flight
+            for task in tasks:
+                task.cancel()
+
+        if listing_error:
+            raise listing_error[0]
+
+    async def _iter_activity_details(
+        self,
+        client: Any,
+        start_date: datetime,
+        end_date: datetime
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Fetch the activities and their details (pipelined), yield them one by one."""
+        count = 0
+        try:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+            # Activities are listed page by page while their details are fetched
+            fetched = self._pipeline_activities(
+                client,
+                semaphore,
+                start_date,
+                end_date,
+                lambda activity: self._call(
+                    semaphore,
+                    client.get_activity_details,
+                    activity["activityId"],
+                    maxchart=2000,
+                    maxpoly=4000,
+                ),
+            )
+
+            async for activity, details in fetched:
+                activity_id = activity["activityId"]
+                if isinstance(details, Exception):
+                    logging.warning(f"Failed details for {activity_id}: {details}")
+                    continue
+
+                # Transform nested arrays in activity and details
+                clean_activity = flatten_nested_arrays(activity, path_factory=lambda: f"activity_{activity_id}")
+                clean_details = flatten_nested_arrays(details, path_factory=lambda: f"details_{activity_id}")
+
+                enriched = {
+                    **clean_activity,
+                    "detailed_data": clean_details,
+                    "data_type": "activity_details"
+                }
+                count += 1
+                yield enriched
+
+            logging.info(f"Fetched details for {count} activities")
         except Exception as e:
             logging.error(f"Error fetching activity details: {e}")
-            return []
 
-    def _fetch_activity_subdata(
+    async def _iter_activity_subdata(
         self,
         client: Any,
         metric_name: str,
         method_name: str,
         start_date: datetime,
         end_date: datetime
-    ) -> List[Dict[str, Any]]:
-        """Generic fetcher for activity-related subdata (splits, weather, etc)."""
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Fetch the activities and their subdata (pipelined), yield them one by one."""
+        count = 0
         try:
-            activities = client.get_activities_by_date(
-                start_date.strftime("%Y-%m-%d"), 
-                end_date.strftime("%Y-%m-%d")
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+            method = self._method_cache.get(metric_name) or getattr(client, method_name)
+            if metric_name == "activity_splits":
+                # Bound once, not per activity
+                split_methods = (
+                    client.get_activity_splits,
+                    client.get_activity_typed_splits,
+                    client.get_activity_split_summaries,
+                )
+
+            async def fetch_one(record: Tuple[Any, ...]) -> Any:
+                activity_id = record[0]
+                # Special case for splits which has multiple calls in original script:
+                # the three split endpoints are requested together
+                if metric_name == "activity_splits":
+                    return await asyncio.gather(
+                        *(
+                            self._call(semaphore, split_method, activity_id)
+                            for split_method in split_methods
+                        )
+                    )
+                return await self._call(semaphore, method, activity_id)
+
+            # Fields copied into every record, extracted once per activity
+            fetched = self._pipeline_activities(
+                client,
+                semaphore,
+                start_date,
+                end_date,
+                fetch_one,
+                to_item=lambda a: (
+                    a["activityId"],
+                    a.get("activityName", ""),
+                    a.get("activityType", ""),
+                    a.get("startTimeLocal", ""),
+                ),
             )
-            
-            results = []
-            method = getattr(client, method_name)
-            
-            for activity in activities:
-                activity_id = activity.get("activityId")
-                if not activity_id:
+
+            async for (activity_id, activity_name, activity_type, start_time_local), subdata in fetched:
+                if isinstance(subdata, Exception):
+                    logging.warning(f"Failed {metric_name} for {activity_id}: {subdata}")
                     continue
-                    
-                try:
-                    # Special case for splits which has multiple calls in original script
-                    if metric_name == "activity_splits":
-                        splits = client.get_activity_splits(activity_id)
-                        # Try/except for other split types if they exist? 
-                        # For simplicity, we stick to the main method defined in config for now,
-                        # but the original script called 3 methods.
-                        # To match original behavior exactly, we might need custom logic here or in config.
-                        # Let's implement the original logic for splits specifically.
-                        typed_splits = client.get_activity_typed_splits(activity_id)
-                        split_summaries = client.get_activity_split_summaries(activity_id)
-                        
-                        # Transform nested arrays
-                        clean_splits = flatten_nested_arrays(splits, path=f"splits_{activity_id}")
-                        clean_typed = flatten_nested_arrays(typed_splits, path=f"typed_splits_{activity_id}")
-                        clean_summaries = flatten_nested_arrays(split_summaries, path=f"summaries_{activity_id}")
-                        
-                        data = {
-                            "activityId": activity_id,
-                            "activityName": activity.get("activityName", ""),
-                            "activityType": activity.get("activityType", ""),
-                            "startTimeLocal": activity.get("startTimeLocal", ""),
-                            "splits": clean_splits,
-                            "typed_splits": clean_typed,
-                            "split_summaries": clean_summaries,
-                            "data_type": metric_name
-                        }
-                    else:
-                        # Standard subdata (weather, hr_zones, etc)
-                        subdata = method(activity_id)
-                        if subdata:
-                            # Transform nested arrays
-                            clean_subdata = flatten_nested_arrays(subdata, path=f"{metric_name}_{activity_id}")
-                            
-                            data = {
-                                "activityId": activity_id,
-                                "activityName": activity.get("activityName", ""),
-                                "activityType": activity.get("activityType", ""),
-                                "startTimeLocal": activity.get("startTimeLocal", ""),
-                                f"{metric_name}_data": clean_subdata, # Naming convention from original script varies...
-                                # Original: weather_data, hr_zones_data, exercise_sets_data
-                                # We might need a mapping for the data key too.
-                                "data_type": metric_name
-                            }
-                            # Fix data key name to match original if possible
-                            if metric_name == "activity_weather":
-                                data["weather_data"] = subdata
-                            elif metric_name == "activity_hr_zones":
-                                data["hr_zones_data"] = subdata
-                            elif metric_name == "activity_exercise_sets":
-                                data["exercise_sets_data"] = subdata
-                        else:
-                            continue
 
-                    results.append(data)
-                    time.sleep(0.3)
-                except Exception as e:
-                    logging.warning(f"Failed {metric_name} for {activity_id}: {e}")
-            
-            logging.info(f"Fetched {metric_name} for {len(results)} activities")
-            return results
+                if metric_name == "activity_splits":
+                    splits, typed_splits, split_summaries = subdata
+
+                    # Transform nested arrays
+                    clean_splits = flatten_nested_arrays(splits, path_factory=lambda: f"splits_{activity_id}")
+                    clean_typed = flatten_nested_arrays(typed_splits, path_factory=lambda: f"typed_splits_{activity_id}")
+                    clean_summaries = flatten_nested_arrays(split_summaries, path_factory=lambda: f"summaries_{activity_id}")
+
+                    data = {
+                        "activityId": activity_id,
+                        "activityName": activity_name,
+                        "activityType": activity_type,
+                        "startTimeLocal": start_time_local,
+                        "splits": clean_splits,
+                        "typed_splits": clean_typed,
+                        "split_summaries": clean_summaries,
+                        "data_type": metric_name
+                    }
+                else:
+                    # Standard subdata (weather, hr_zones, etc)
+                    if not subdata:
+                        continue
+
+                    # Transform nested arrays
+                    clean_subdata = flatten_nested_arrays(subdata, path_factory=lambda: f"{metric_name}_{activity_id}")
+
+                    data = {
+                        "activityId": activity_id,
+                        "activityName": activity_name,
+                        "activityType": activity_type,
+                        "startTimeLocal": start_time_local,
+                        f"{metric_name}_data": clean_subdata, # Naming convention from original script varies...
+                        # Original: weather_data, hr_zones_data, exercise_sets_data
+                        # We might need a mapping for the data key too.
+                        "data_type": metric_name
+                    }
+                    # Fix data key name to match original if possible
+                    if metric_name == "activity_weather":
+                        data["weather_data"] = subdata
+                    elif metric_name == "activity_hr_zones":
+                        data["hr_zones_data"] = subdata
+                    elif metric_name == "activity_exercise_sets":
+                        data["exercise_sets_data"] = subdata
+
+                count += 1
+                yield data
+
+            logging.info(f"Fetched {metric_name} for {count} activities")
         except Exception as e:
             logging.error(f"Error fetching {metric_name}: {e}")
-            return []
@@ -3,14 +3,25 @@ Garmin Connector Utilities
 --------------------------
 Helper functions for date handling, file I/O, and logging.
 """
+import asyncio
 import logging
 import json
-from datetime import datetime
+import threading
+import time
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional
 from zoneinfo import ZoneInfo
 
-from .config import DEFAULT_TIMEZONE
+from .config import DEFAULT_TIMEZONE, IMMUTABLE_AFTER_DAYS
+
+try:
+    import orjson
+except ImportError:  # orjson optionnel, repli sur json
+    orjson = None
+
+# Buffer d'écriture JSONL : les lignes sont regroupées en écritures de 1 MiB
+JSONL_BUFFER_SIZE = 1 << 20
 
 def setup_logging(level: str = "INFO") -> None:
     """Configure logging format and level."""
@@ -22,22 +33,116 @@ def setup_logging(level: str = "INFO") -> None:
         force=True # Ensure we override any existing config
     )
 
-def to_jsonl(data: List[Dict[str, Any]], jsonl_output_path: str) -> None:
-    """Write list of dicts to JSONL file."""
-    with open(jsonl_output_path, 'w', encoding='utf-8') as f:
-        for entry in data:
-            f.write(json.dumps(entry, default=str) + '\n')
+class RateLimiter:
+    """
+    Espace les requêtes à `rate` par seconde, partagé entre tâches et threads.
+
+    Chaque appel réserve le prochain créneau libre puis attend (asyncio ou
+    time.sleep) : les requêtes concurrentes restent sous le plafond Garmin
+    sans être sérialisées sur leur latence.
+
+    Le débit est adaptatif (AIMD) : throttle() le divise par deux après un
+    429 et peut geler les créneaux le temps du Retry-After, recover() le
+    remonte par petits pas après chaque succès, jusqu'à max_rate.
+    Jusqu'à `burst` requêtes peuvent partir d'un coup quand le crédit est
+    disponible (seau à jetons, sous forme GCRA).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        per: float = 1.0,
+        max_rate: Optional[float] = None,
+        min_rate: Optional[float] = None,
+        burst: int = 1,
+    ):
+        self._per = per
+        self._burst = max(1, burst)
+        self._rate = rate
+        self._max_rate = max_rate or rate
+        self._min_rate = min_rate or rate / 8
+        # Additive increase: ~20 successes to go from min_rate to max_rate
+        self._step = (self._max_rate - self._min_rate) / 20
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current requests per `per` seconds."""
+        return self._rate
+
+    def _reserve(self) -> float:
+        """Book the next slot and return the delay until it."""
+        with self._lock:
+            now = time.monotonic()
+            interval = self._per / self._rate
+            # Theoretical arrival time: requests may run ahead of it by burst - 1 slots
+            arrival = max(now, self._next_slot)
+            self._next_slot = arrival + interval
+            return max(0.0, arrival - (self._burst - 1) * interval - now)
+
+    async def acquire(self) -> None:
+        """Wait (without blocking the event loop) for the next slot."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def throttle(self, pause: Optional[float] = None) -> None:
+        """Halve the rate after a 429; hold every slot for `pause` seconds if given."""
+        with self._lock:
+            self._rate = max(self._min_rate, self._rate / 2)
+            if pause:
+                # Shift past the burst allowance so the pause holds for every request
+                hold = pause + (self._burst - 1) * self._per / self._rate
+                self._next_slot = max(self._next_slot, time.monotonic() + hold)
+
+    def recover(self) -> None:
+        """Raise the rate a notch after a successful request."""
+        if self._rate >= self._max_rate:
+            return
+        with self._lock:
+            self._rate = min(self._max_rate, self._rate + self._step)
+
+def closed_day_cutoff() -> str:
+    """ISO date before which a day is closed (ISO dates compare as strings)."""
+    return (date.today() - timedelta(days=IMMUTABLE_AFTER_DAYS)).isoformat()
 
-def write_jsonl(data: List[Dict[str, Any]], output_path: Path) -> None:
-    """Write a list of dicts to a JSONL file with directory creation."""
+def to_jsonl(data: List[Dict[str, Any]], jsonl_output_path: str, append: bool = False) -> None:
+    """Write (or append) list of dicts to JSONL file (lines coalesced into 1 MiB writes)."""
+    if orjson is not None:
+        # datetime passe par default=str, comme avec json.dumps
+        options = (
+            orjson.OPT_APPEND_NEWLINE
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        lines = (orjson.dumps(entry, default=str, option=options) for entry in data)
+    else:
+        lines = (
+            (json.dumps(entry, default=str) + '\n').encode('utf-8') for entry in data
+        )
+
+    with open(jsonl_output_path, 'ab' if append else 'wb', buffering=JSONL_BUFFER_SIZE) as f:
+        f.writelines(lines)
+
+def write_jsonl(data: List[Dict[str, Any]], output_path: Path, append: bool = False) -> None:
+    """
+    Write a list of dicts to a JSONL file with directory creation.
+
+    With append=True the items are added to the end of the file, to dump
+    a stream batch by batch.
+    """
     try:
         if not data:
             logging.warning(f"No data to write for {output_path}")
             return
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        to_jsonl(data, jsonl_output_path=str(output_path))
-        logging.info(f"📁 Dump saved to: {output_path} ({len(data)} items)")
+        to_jsonl(data, jsonl_output_path=str(output_path), append=append)
+        if append:
+            logging.debug(f"Appended {len(data)} items to {output_path}")
+        else:
+            logging.info(f"📁 Dump saved to: {output_path} ({len(data)} items)")
     except Exception as e:
         raise IOError(f"Failed to write JSONL file: {e}") from e
 
@@ -55,10 +160,18 @@ def generate_output_filename(
     timestamp = datetime.now(tz=tz).strftime("%Y_%m_%d_%H_%M")
     return output_dir / f"{timestamp}_garmin_{data_type}.jsonl"
 
+def _child_path(parent: Callable[[], str], key: Any, is_index: bool = False) -> Callable[[], str]:
+    """Chemin d'un enfant (parent.key ou parent[i]), construit seulement s'il est logué."""
+    if is_index:
+        return lambda: f"{parent()}[{key}]"
+    return lambda: f"{parent()}.{key}"
+
+
 def flatten_nested_arrays(
     obj: Any, 
     known_mappings: Dict[str, List[str]] = None,
-    path: str = ""
+    path: str = "",
+    path_factory: Optional[Callable[[], str]] = None
 ) -> Any:
     """
     Transforme récursivement les nested arrays pour compatibilité BigQuery.
@@ -71,6 +184,8 @@ def flatten_nested_arrays(
         known_mappings: Mappings explicites pour les cas spéciaux
             Format: {"field_name": ["key1", "key2", ...]}
         path: Chemin actuel dans l'objet (pour logging)
+        path_factory: Variante paresseuse de path, appelée uniquement quand
+            un message est réellement logué
     
     Returns:
         Objet transformé avec nested arrays aplatis
@@ -98,6 +213,11 @@ def flatten_nested_arrays(
             }
         }
     
+    # Le chemin ne sert qu'aux logs : il n'est formaté que s'il est émis
+    if path_factory is None:
+        path_factory = lambda: path
+    debug_enabled = logging.root.isEnabledFor(logging.DEBUG)
+
     # Cas 1 : Dict → récursion sur chaque clé
     if isinstance(obj, dict):
         # Special handling for Garmin activity details metrics
@@ -129,9 +249,10 @@ def flatten_nested_arrays(
                     new_metrics.append(structured_metric)
                 
                 obj['activityDetailMetrics'] = new_metrics
-                logging.debug(f"Transformed activityDetailMetrics at '{path}' using descriptors")
+                if debug_enabled:
+                    logging.debug(f"Transformed activityDetailMetrics at '{path_factory()}' using descriptors")
             except Exception as e:
-                logging.warning(f"Failed to transform activityDetailMetrics at '{path}': {e}")
+                logging.warning(f"Failed to transform activityDetailMetrics at '{path_factory()}': {e}")
 
         result = {}
         for key, value in obj.items():
@@ -145,6 +266,11 @@ def flatten_nested_arrays(
                 result[key] = None
                 continue
 
+            # Primitive → copiée telle quelle, sans récursion
+            if not isinstance(value, (dict, list)):
+                result[key] = value
+                continue
+
             # Vérifier si cette clé est un cas spécial connu
             if key in known_mappings and isinstance(value, list) and value and isinstance(value[0], list):
                 mapping = known_mappings[key]
@@ -165,13 +291,18 @@ def flatten_nested_arrays(
                         dict(zip(field_names, item[:len(field_names)])) 
                         for item in value
                     ]
-                    logging.debug(f"Transformed nested array at '{path}.{key}' using mapping: {field_names}")
+                    if debug_enabled:
+                        logging.debug(f"Transformed nested array at '{path_factory()}.{key}' using mapping: {field_names}")
                 else:
                     # Fallback to recursion if no mapping found for this length
                     # This allows the generic fallback in Cas 2 to handle it (e.g. logging warning)
-                     result[key] = flatten_nested_arrays(value, known_mappings, f"{path}.{key}")
+                     result[key] = flatten_nested_arrays(
+                         value, known_mappings, path_factory=_child_path(path_factory, key)
+                     )
             else:
-                result[key] = flatten_nested_arrays(value, known_mappings, f"{path}.{key}")
+                result[key] = flatten_nested_arrays(
+                    value, known_mappings, path_factory=_child_path(path_factory, key)
+                )
         return result
     
     # Cas 2 : List → vérifier si c'est un nested array
@@ -186,13 +317,14 @@ def flatten_nested_arrays(
             # Cas 2a : Longueur 2 → fallback générique (timestamp, value)
             if first_item_length == 2:
                 result = [{'timestamp': item[0], 'value': item[1]} for item in obj]
-                logging.debug(f"Transformed generic 2-element nested array at '{path}'")
+                if debug_enabled:
+                    logging.debug(f"Transformed generic 2-element nested array at '{path_factory()}'")
                 return result
             
             # Cas 2b : Longueur > 2 → WARNING (devrait avoir un mapping explicite)
             else:
                 logging.warning(
-                    f"⚠️ Nested array with {first_item_length} elements found at '{path}' "
+                    f"⚠️ Nested array with {first_item_length} elements found at '{path_factory()}' "
                     f"without explicit mapping. Consider adding to known_mappings. "
                     f"Using generic keys: val_0, val_1, ..."
                 )
@@ -204,7 +336,14 @@ def flatten_nested_arrays(
         
         # Pas un nested array → récursion sur chaque élément
         else:
-            return [flatten_nested_arrays(item, known_mappings, f"{path}[{i}]") for i, item in enumerate(obj)]
+            return [
+                flatten_nested_arrays(
+                    item, known_mappings, path_factory=_child_path(path_factory, i, is_index=True)
+                )
+                if isinstance(item, (dict, list))
+                else item
+                for i, item in enumerate(obj)
+            ]
     
     # Cas 3 : Primitive (str, int, float, bool, None) → retour direct
     else:
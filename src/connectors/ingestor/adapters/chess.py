@@ -7,11 +7,24 @@ Wraps the existing chess_ingest.py to provide a unified interface.
 import logging
 import os
 import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 import json
 
+try:
+    import orjson
+
+    def _dumps_line(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+except ImportError:
+
+    def _dumps_line(obj) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
 
@@ -20,6 +33,14 @@ from google.cloud import bigquery, storage
 
 logger = logging.getLogger(__name__)
 
+# NDJSON payload kept in RAM up to this size, spilled to a temp file beyond
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+# Read size used when streaming JSONL blobs from GCS
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Bad lines logged in detail per file; the rest are only counted
+MAX_LOGGED_LINE_ERRORS = 10
+
 # Chess data types
 CHESS_DATA_TYPES = [
     "player_profile",
@@ -153,56 +174,85 @@ class ChessIngestorAdapter(IngestorAdapter):
         blob_path = "/".join(parts[3:])
         filename = parts[-1]
 
-        # Download from GCS
+        # Stream from GCS and re-encode each row straight into an NDJSON
+        # payload: peak memory is bounded by SPOOL_MAX_SIZE, not by the file
         storage_client = storage.Client()
         bucket = storage_client.bucket(bucket_name)
         blob = bucket.blob(blob_path)
-        content = blob.download_as_text().splitlines()
 
-        rows = []
-        for line_num, line in enumerate(content, 1):
-            try:
-                # Parse original data (validation only)
-                original_data = json.loads(line)
-
-                # Create row with minimal structure
-                row = {
-                    "raw_data": original_data,
-                    "data_type": file_type,
-                    "username": username,
-                    "dp_inserted_at": inserted_at,
-                    "source_file": filename,
-                }
-
-                rows.append(row)
-
-            except json.JSONDecodeError as e:
-                logger.warning(f"Invalid JSON on line {line_num} in {filename}: {e}")
-                continue
-            except Exception as e:
+        row_count = 0
+        error_count = 0
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as payload:
+            with blob.open(
+                "rt", encoding="utf-8", chunk_size=DOWNLOAD_CHUNK_SIZE
+            ) as fh:
+                for line_num, line in enumerate(fh, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        # Parse original data (validation only)
+                        original_data = json.loads(line)
+
+                        # Create row with minimal structure
+                        row = {
+                            "raw_data": original_data,
+                            "data_type": file_type,
+                            "username": username,
+                            "dp_inserted_at": inserted_at,
+                            "source_file": filename,
+                        }
+
+                        payload.write(_dumps_line(row))
+                        row_count += 1
+
+                    except json.JSONDecodeError as e:
+                        error_count += 1
+                        if error_count <= MAX_LOGGED_LINE_ERRORS:
+                            logger.warning(
+                                "Invalid JSON on line %d in %s: %s",
+                                line_num,
+                                filename,
+                                e,
+                            )
+                        continue
+                    except Exception as e:
+                        error_count += 1
+                        if error_count <= MAX_LOGGED_LINE_ERRORS:
+                            logger.warning(
+                                "Processing error on line %d in %s: %s",
+                                line_num,
+                                filename,
+                                e,
+                            )
+                        continue
+
+            if error_count:
                 logger.warning(
-                    f"Processing error on line {line_num} in {filename}: {e}"
+                    "%d bad lines in %s (first %d logged)",
+                    error_count,
+                    filename,
+                    min(error_count, MAX_LOGGED_LINE_ERRORS),
                 )
-                continue
-
-        if not rows:
-            raise ValueError(f"No valid records found in {filename}")
-
-        # Load to BigQuery with universal schema
-        bq_client = bigquery.Client()
-        job = bq_client.load_table_from_json(
-            rows,
-            table_id,
-            job_config=bigquery.LoadJobConfig(
-                schema=self._get_universal_schema(),
-                write_disposition="WRITE_APPEND",
-                source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
-                autodetect=False,
-            ),
-        )
 
-        job.result()
-        logger.info(f"Loaded {filename} with {len(rows)} rows to {table_id}")
+            if not row_count:
+                raise ValueError(f"No valid records found in {filename}")
+
+            # Single load job per file: a failure never leaves a partial file
+            payload.seek(0)
+            bq_client = bigquery.Client()
+            job = bq_client.load_table_from_file(
+                payload,
+                table_id,
+                job_config=bigquery.LoadJobConfig(
+                    schema=self._get_universal_schema(),
+                    write_disposition="WRITE_APPEND",
+                    source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+                    autodetect=False,
+                ),
+            )
+            job.result()
+
+        logger.info(f"Loaded {filename} with {row_count} rows to {table_id}")
 
     def ingest(
         self,
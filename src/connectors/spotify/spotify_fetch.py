@@ -16,10 +16,12 @@ import os
 import sys
 import argparse
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Callable, Iterator
 from dataclasses import dataclass
 from enum import Enum
 
@@ -34,6 +36,12 @@ from utils import to_jsonl
 # Constants
 DEFAULT_LIMIT = 50
 DEFAULT_TIMEZONE = "Europe/Paris"
+PAGE_SIZE = 50  # Max API limit for offset-paginated endpoints
+PAGINATION_WORKERS = 4  # Concurrent page requests once the total is known
+# Retry policy applied by spotipy's urllib3 session (429 / 5xx)
+API_RETRIES = 5
+API_BACKOFF_FACTOR = 0.5
+TOKEN_REUSE_MARGIN_SECONDS = 60  # Cached access tokens closer to expiry are refreshed
 REQUIRED_ENV_VARS = [
     "SPOTIFY_CLIENT_ID",
     "SPOTIFY_CLIENT_SECRET",
@@ -113,31 +121,36 @@ class SpotifyConnector:
                 cache_path=str(self.config.cache_path),
             )
 
-            # Clear any existing cache to force re-authentication with new scopes
-            if self.config.cache_path.exists():
-                self.config.cache_path.unlink()
-                logging.debug("Cleared existing token cache")
+            # Reuse the cached access token when it still covers the run
+            access_token = self._cached_access_token(auth_manager, required_scopes)
 
-            # Try to get token using refresh token
-            try:
-                token_info = auth_manager.refresh_access_token(
-                    self.config.refresh_token
-                )
-                access_token = token_info.get("access_token")
-            except Exception as refresh_error:
-                logging.warning(f"Refresh token failed: {refresh_error}")
-                # If refresh fails, we need to do full OAuth flow
-                # For now, raise an error with instructions
-                raise SpotifyConnectorError(
-                    "Refresh token authentication failed. You may need to re-authorize "
-                    "with the new scopes. Please check your refresh token or run the "
-                    "initial OAuth flow again."
-                )
+            # Otherwise mint a new one from the refresh token (spotipy writes
+            # it back to the cache for the next run)
+            if not access_token:
+                try:
+                    token_info = auth_manager.refresh_access_token(
+                        self.config.refresh_token
+                    )
+                    access_token = token_info.get("access_token")
+                except Exception as refresh_error:
+                    logging.warning(f"Refresh token failed: {refresh_error}")
+                    # If refresh fails, we need to do full OAuth flow
+                    # For now, raise an error with instructions
+                    raise SpotifyConnectorError(
+                        "Refresh token authentication failed. You may need to re-authorize "
+                        "with the new scopes. Please check your refresh token or run the "
+                        "initial OAuth flow again."
+                    )
 
             if not access_token:
                 raise SpotifyConnectorError("Failed to get access token")
 
-            self._client = spotipy.Spotify(auth=access_token)
+            self._client = spotipy.Spotify(
+                auth=access_token,
+                retries=API_RETRIES,
+                status_retries=API_RETRIES,
+                backoff_factor=API_BACKOFF_FACTOR,
+            )
             self._authenticated_scopes = required_scopes
 
             # Test the authentication by making a simple API call
@@ -152,6 +165,29 @@ class SpotifyConnector:
         except Exception as e:
             raise SpotifyConnectorError(f"Authentication failed: {e}") from e
 
+    @staticmethod
+    def _cached_access_token(
+        auth_manager: SpotifyOAuth, required_scopes: set
+    ) -> Optional[str]:
+        """Access token from the cache if it is fresh and has the needed scopes."""
+        try:
+            token_info = auth_manager.cache_handler.get_cached_token()
+        except Exception as e:
+            logging.debug(f"Unreadable token cache: {e}")
+            return None
+        if not token_info:
+            return None
+
+        remaining = token_info.get("expires_at", 0) - time.time()
+        if remaining <= TOKEN_REUSE_MARGIN_SECONDS:
+            return None
+        if not required_scopes <= set((token_info.get("scope") or "").split()):
+            logging.debug("Cached token lacks required scopes")
+            return None
+
+        logging.debug(f"Reusing cached access token ({int(remaining)}s left)")
+        return token_info.get("access_token")
+
     @property
     def client(self) -> spotipy.Spotify:
         """Get the authenticated Spotify client."""
@@ -159,6 +195,73 @@ class SpotifyConnector:
             raise SpotifyConnectorError("Not authenticated. Call authenticate() first.")
         return self._client
 
+    @staticmethod
+    def _added_since(item: Dict[str, Any], since: datetime) -> bool:
+        """Whether a saved item was added at or after ``since``."""
+        added_at_str = item.get("added_at", "")
+        if not added_at_str:
+            return False
+        added_at = datetime.fromisoformat(added_at_str.replace("Z", "+00:00"))
+        return added_at >= since
+
+    @staticmethod
+    def _iter_pages(
+        fetch_page: Callable[..., Dict[str, Any]],
+        prefetch_next: Callable[[List[Dict[str, Any]]], bool],
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield offset-paginated batches, downloading page N+1 in the background
+        while the caller filters page N.
+
+        The next page is only requested when ``prefetch_next(batch)`` says the
+        caller will need it, so an early stop never costs an extra API call.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offset = 0
+            future = executor.submit(fetch_page, limit=PAGE_SIZE, offset=offset)
+            while future is not None:
+                batch_items = future.result().get("items", [])
+                if not batch_items:
+                    return
+                offset += len(batch_items)
+
+                future = None
+                # Fewer items than requested means we've reached the end
+                if len(batch_items) == PAGE_SIZE and prefetch_next(batch_items):
+                    future = executor.submit(fetch_page, limit=PAGE_SIZE, offset=offset)
+                yield batch_items
+
+    @staticmethod
+    def _fetch_offset_pages(
+        fetch_page: Callable[..., Dict[str, Any]], limit: int, **params
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch up to ``limit`` items from an offset-paginated endpoint.
+
+        The first page gives the total; the remaining offsets are then known
+        up-front and requested concurrently (spotipy's session retries 429s,
+        honouring Retry-After). Pages are concatenated in offset order.
+        """
+        first = fetch_page(limit=min(limit, PAGE_SIZE), offset=0, **params)
+        items = first.get("items", [])
+        wanted = min(limit, first.get("total") or len(items))
+        offsets = range(PAGE_SIZE, wanted, PAGE_SIZE)
+        if not offsets or len(items) < PAGE_SIZE:
+            return items[:limit]
+
+        with ThreadPoolExecutor(
+            max_workers=min(PAGINATION_WORKERS, len(offsets))
+        ) as executor:
+            pages = executor.map(
+                lambda offset: fetch_page(
+                    limit=min(PAGE_SIZE, wanted - offset), offset=offset, **params
+                ),
+                offsets,
+            )
+            for page in pages:
+                items.extend(page.get("items", []))
+        return items[:limit]
+
     def fetch_recently_played(self, limit: int = DEFAULT_LIMIT) -> List[Dict[str, Any]]:
         """Fetch recently played tracks with 1-hour safety buffer (from 23:00 yesterday)."""
         try:
@@ -200,41 +303,29 @@ class SpotifyConnector:
             yesterday_23h_paris = today_midnight_paris - timedelta(hours=1)
 
             filtered_items = []
-            offset = 0
-            batch_size = 50  # Max API limit
-
-            while len(filtered_items) < limit:
-                # Fetch batch from API
-                results = self.client.current_user_saved_tracks(
-                    limit=batch_size, offset=offset
-                )
-                batch_items = results.get("items", [])
-
-                if not batch_items:
-                    break
+            pages = self._iter_pages(
+                self.client.current_user_saved_tracks,
+                # Items are ordered by recency: the next page is only useful
+                # while the current one ends with recent items
+                prefetch_next=lambda batch: len(filtered_items) + len(batch) < limit
+                and self._added_since(batch[-1], yesterday_23h_paris),
+            )
 
+            for batch_items in pages:
                 # Filter by added_at timestamp (client-side)
                 for item in batch_items:
-                    added_at_str = item.get("added_at", "")
-                    if added_at_str:
-                        added_at = datetime.fromisoformat(
-                            added_at_str.replace("Z", "+00:00")
+                    if not item.get("added_at", ""):
+                        continue
+                    if self._added_since(item, yesterday_23h_paris):
+                        filtered_items.append(item)
+                    else:
+                        # Items are ordered by recency, so stop when we hit older items
+                        logging.info(
+                            f"Fetched {len(filtered_items)} saved tracks added since 23:00 yesterday"
                         )
-                        added_at_paris = added_at.astimezone(paris_tz)
-
-                        if added_at_paris >= yesterday_23h_paris:
-                            filtered_items.append(item)
-                        else:
-                            # Items are ordered by recency, so stop when we hit older items
-                            logging.info(
-                                f"Fetched {len(filtered_items)} saved tracks added since 23:00 yesterday"
-                            )
-                            return filtered_items[:limit]
+                        return filtered_items[:limit]
 
-                offset += len(batch_items)
-
-                # If we got fewer items than requested, we've reached the end
-                if len(batch_items) < batch_size:
+                if len(filtered_items) >= limit:
                     break
 
             logging.info(
@@ -257,41 +348,29 @@ class SpotifyConnector:
             yesterday_23h_paris = today_midnight_paris - timedelta(hours=1)
 
             filtered_items = []
-            offset = 0
-            batch_size = 50  # Max API limit
-
-            while len(filtered_items) < limit:
-                # Fetch batch from API
-                results = self.client.current_user_saved_albums(
-                    limit=batch_size, offset=offset
-                )
-                batch_items = results.get("items", [])
-
-                if not batch_items:
-                    break
+            pages = self._iter_pages(
+                self.client.current_user_saved_albums,
+                # Items are ordered by recency: the next page is only useful
+                # while the current one ends with recent items
+                prefetch_next=lambda batch: len(filtered_items) + len(batch) < limit
+                and self._added_since(batch[-1], yesterday_23h_paris),
+            )
 
+            for batch_items in pages:
                 # Filter by added_at timestamp (client-side)
                 for item in batch_items:
-                    added_at_str = item.get("added_at", "")
-                    if added_at_str:
-                        added_at = datetime.fromisoformat(
-                            added_at_str.replace("Z", "+00:00")
+                    if not item.get("added_at", ""):
+                        continue
+                    if self._added_since(item, yesterday_23h_paris):
+                        filtered_items.append(item)
+                    else:
+                        # Items are ordered by recency, so stop when we hit older items
+                        logging.info(
+                            f"Fetched {len(filtered_items)} saved albums added since 23:00 yesterday"
                         )
-                        added_at_paris = added_at.astimezone(paris_tz)
-
-                        if added_at_paris >= yesterday_23h_paris:
-                            filtered_items.append(item)
-                        else:
-                            # Items are ordered by recency, so stop when we hit older items
-                            logging.info(
-                                f"Fetched {len(filtered_items)} saved albums added since 23:00 yesterday"
-                            )
-                            return filtered_items[:limit]
+                        return filtered_items[:limit]
 
-                offset += len(batch_items)
-
-                # If we got fewer items than requested, we've reached the end
-                if len(batch_items) < batch_size:
+                if len(filtered_items) >= limit:
                     break
 
             logging.info(
@@ -345,8 +424,7 @@ class SpotifyConnector:
     def fetch_playlists(self, limit: int = DEFAULT_LIMIT) -> List[Dict[str, Any]]:
         """Fetch user's playlists."""
         try:
-            results = self.client.current_user_playlists(limit=limit)
-            items = results.get("items", [])
+            items = self._fetch_offset_pages(self.client.current_user_playlists, limit)
             logging.info(f"Fetched {len(items)} playlists")
             return items
         except Exception as e:
@@ -366,10 +444,9 @@ class SpotifyConnector:
     ) -> List[Dict[str, Any]]:
         """Fetch user's top tracks."""
         try:
-            results = self.client.current_user_top_tracks(
-                limit=limit, time_range=time_range
+            items = self._fetch_offset_pages(
+                self.client.current_user_top_tracks, limit, time_range=time_range
             )
-            items = results.get("items", [])
             logging.info(f"Fetched {len(items)} top tracks ({time_range})")
             return items
         except Exception as e:
@@ -380,10 +457,9 @@ class SpotifyConnector:
     ) -> List[Dict[str, Any]]:
         """Fetch user's top artists."""
         try:
-            results = self.client.current_user_top_artists(
-                limit=limit, time_range=time_range
+            items = self._fetch_offset_pages(
+                self.client.current_user_top_artists, limit, time_range=time_range
             )
-            items = results.get("items", [])
             logging.info(f"Fetched {len(items)} top artists ({time_range})")
             return items
         except Exception as e:
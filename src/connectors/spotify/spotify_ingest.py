@@ -42,14 +42,16 @@ Last Updated: 2025-11-01
 """
 
 import argparse
+import io
 import json
 import logging
 import os
+import re
 import sys
 import time
 import traceback
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -229,6 +231,29 @@ class IngestionConfig:
 # =============================================================================
 
 
+# Formes canoniques parsées par fromisoformat (C) ; toute autre valeur passe
+# par strptime, qui garde la validation d'origine (pas de fuseau, pas de date
+# seule), pour ne jamais mélanger datetimes naïfs et aware
+_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+_CANONICAL_DATETIME = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", re.ASCII)
+_CANONICAL_DATE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+_CANONICAL_YEAR_MONTH = re.compile(r"\d{4}(-\d{2})?", re.ASCII)
+
+
+def _parse_datetime(value: str) -> datetime:
+    """Naive datetime from "YYYY-MM-DD HH:MM:SS", strict like strptime."""
+    if _CANONICAL_DATETIME.fullmatch(value):
+        return datetime.fromisoformat(value)
+    return datetime.strptime(value, _DATETIME_FORMAT)
+
+
+def _parse_date(value: str) -> date:
+    """Date from "YYYY-MM-DD", strict like strptime."""
+    if _CANONICAL_DATE.fullmatch(value):
+        return date.fromisoformat(value)
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
 class DataTransformer:
     """Apply transformations to extracted values"""
 
@@ -258,7 +283,7 @@ class DataTransformer:
                     ).replace(tzinfo=None)
                 elif isinstance(value, str):
                     # Parse string datetime (format: "YYYY-MM-DD HH:MM:SS")
-                    return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+                    return _parse_datetime(value)
 
             elif transform_type == "timestamp_ms_to_date":
                 # Convert Garmin timestamp to date only (UTC)
@@ -270,7 +295,7 @@ class DataTransformer:
                     ).date()
                 elif isinstance(value, str):
                     # Parse string datetime and extract date
-                    return datetime.strptime(value, "%Y-%m-%d %H:%M:%S").date()
+                    return _parse_datetime(value).date()
 
             elif transform_type == "string_to_date":
                 # Convert string date (YYYY-MM-DD) or ISO timestamp to date
@@ -282,7 +307,7 @@ class DataTransformer:
                         return datetime.fromisoformat(value).date()
                     # Try simple date format (YYYY-MM-DD)
                     else:
-                        return datetime.strptime(value, "%Y-%m-%d").date()
+                        return _parse_date(value)
                 return value
 
             elif transform_type == "string_to_timestamp":
@@ -312,11 +337,15 @@ class DataTransformer:
                 # Convert YYYY, YYYY-MM, or YYYY-MM-DD to date
                 if isinstance(value, str):
                     if len(value) == 4:  # YYYY
-                        return datetime.strptime(value, "%Y").date()
+                        if not _CANONICAL_YEAR_MONTH.fullmatch(value):
+                            return datetime.strptime(value, "%Y").date()
+                        return date(int(value), 1, 1)
                     elif len(value) == 7:  # YYYY-MM
-                        return datetime.strptime(value, "%Y-%m").date()
+                        if not _CANONICAL_YEAR_MONTH.fullmatch(value):
+                            return datetime.strptime(value, "%Y-%m").date()
+                        return date(int(value[:4]), int(value[5:7]), 1)
                     else:  # YYYY-MM-DD
-                        return datetime.strptime(value, "%Y-%m-%d").date()
+                        return _parse_date(value)
                 return value
 
         except (ValueError, TypeError, OSError) as e:
@@ -1181,9 +1210,15 @@ class SpotifyIngestor:
         # Single insert for all records
         timeout = self.config.performance.get("bq_job_timeout_seconds", 600)
 
+        # Pre-serialize to NDJSON bytes: load_table_from_json deep-copies every
+        # row, which is costly for the nested track.album.artists records.
+        payload = "".join(
+            json.dumps(r, ensure_ascii=False) + "\n" for r in serialized_records
+        ).encode("utf-8")
+
         try:
-            job = self.bq_client.load_table_from_json(
-                serialized_records, self.table_id, job_config=job_config
+            job = self.bq_client.load_table_from_file(
+                io.BytesIO(payload), self.table_id, job_config=job_config
             )
 
             job.result(timeout=timeout)
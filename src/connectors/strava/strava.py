@@ -1,13 +1,22 @@
 import os
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
+import requests
 from stravalib import Client
 from pathlib import Path
 
+try:
+    import requests_cache
+except ImportError:  # cache HTTP optionnel
+    requests_cache = None
+
 # Configuration
 TOKEN_FILE = os.path.join(os.path.dirname(__file__), "strava_tokens.json")
+CACHE_FILE = os.path.join(os.path.dirname(__file__), ".strava_cache")
+CACHE_EXPIRE_SECONDS = 3600
 DATA_DIR = Path(__file__).parent.parent / "data"
 DAYS = 10  # Nombre de jours en arrière pour récupérer les activités
 
@@ -29,9 +38,36 @@ REDIRECT_URI = os.getenv("STRAVA_REDIRECT_URI", "http://localhost")
 SCOPES = ["activity:read_all", "profile:read_all"]
 
 
+def save_tokens(toks):
+    """Écrit les tokens de façon atomique (fichier temporaire + os.replace)."""
+    tmp_path = TOKEN_FILE + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(toks, f)
+    os.replace(tmp_path, TOKEN_FILE)
+
+
+def build_session():
+    """Session HTTP partagée (keep-alive) ; les réponses par activité
+    (kudos, comments, laps, streams) sont mises en cache si requests_cache
+    est installé. La liste des activités n'est jamais mise en cache."""
+    if requests_cache is None:
+        return requests.Session()
+    per_activity = {
+        f"*/activities/*/{endpoint}": CACHE_EXPIRE_SECONDS
+        for endpoint in ("kudos", "comments", "laps", "streams")
+    }
+    return requests_cache.CachedSession(
+        CACHE_FILE,
+        backend="sqlite",
+        allowable_methods=("GET",),
+        expire_after=requests_cache.DO_NOT_CACHE,
+        urls_expire_after=per_activity,
+    )
+
+
 def init_client():
     load_dotenv()
-    client = Client()
+    client = Client(requests_session=build_session())
     cid = os.getenv("STRAVA_CLIENT_ID")
     csec = os.getenv("STRAVA_CLIENT_SECRET")
     env_ref = os.getenv("STRAVA_REFRESH_TOKEN")
@@ -44,8 +80,7 @@ def init_client():
         toks = client.exchange_code_for_token(
             client_id=cid, client_secret=csec, code=code
         )
-        with open(TOKEN_FILE, "w") as f:
-            json.dump(toks, f)
+        save_tokens(toks)
     else:
         toks = json.load(open(TOKEN_FILE))
     now = int(time.time())
@@ -55,8 +90,7 @@ def init_client():
             client_secret=csec,
             refresh_token=toks.get("refresh_token", env_ref),
         )
-        with open(TOKEN_FILE, "w") as f:
-            json.dump(toks, f)
+        save_tokens(toks)
     client.access_token = toks["access_token"]
     client.refresh_token = toks["refresh_token"]
     client.token_expires_at = toks["expires_at"]
@@ -65,9 +99,12 @@ def init_client():
 
 def dump_jsonl(records, path):
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w") as f:
-        for rec in records:
-            f.write(json.dumps(rec, ensure_ascii=False, default=str) + "\n")
+    # Fichier encodé en un seul bloc : un seul write() au lieu d'un par ligne
+    payload = "".join(
+        json.dumps(rec, ensure_ascii=False, default=str) + "\n" for rec in records
+    )
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(payload)
     print(f"✅ Dump : {path} ({len(records)} lignes)")
 
 
@@ -88,43 +125,52 @@ def main():
     )
 
     # Kudos, Comments, Laps, Streams
+    # IDs extraits une seule fois : la boucle ne manipule plus les objets activité
+    activity_ids = [a.id for a in acts if a.id is not None]
     kudos, comments, laps, streams = [], [], [], []
-    for idx, a in enumerate(acts):
+    for idx, aid in enumerate(activity_ids):
         try:
-            print(f"⏳ Activité {a.id} ({idx+1}/{len(acts)})")
+            print(f"⏳ Activité {aid} ({idx+1}/{len(activity_ids)})")
             # Kudos
             try:
-                kudos += [k.model_dump() for k in client.get_activity_kudos(a.id)]
+                kudos += [k.model_dump() for k in client.get_activity_kudos(aid)]
             except Exception as e:
-                print(f"⚠️ Kudos erreur pour {a.id} : {e}")
+                print(f"⚠️ Kudos erreur pour {aid} : {e}")
             # Comments
             try:
-                comments += [c.model_dump() for c in client.get_activity_comments(a.id)]
+                comments += [c.model_dump() for c in client.get_activity_comments(aid)]
             except Exception as e:
-                print(f"⚠️ Comments erreur pour {a.id} : {e}")
+                print(f"⚠️ Comments erreur pour {aid} : {e}")
             # Laps
             try:
-                laps += [lap.model_dump() for lap in client.get_activity_laps(a.id)]
+                laps += [lap.model_dump() for lap in client.get_activity_laps(aid)]
             except Exception as e:
-                print(f"⚠️ Laps erreur pour {a.id} : {e}")
+                print(f"⚠️ Laps erreur pour {aid} : {e}")
             # Streams
             try:
-                sdict = client.get_activity_streams(a.id, types=STREAM_TYPES)
+                sdict = client.get_activity_streams(aid, types=STREAM_TYPES)
                 streams.append(
                     {
-                        "activity_id": a.id,
+                        "activity_id": aid,
                         "streams": {k: v.model_dump() for k, v in sdict.items()},
                     }
                 )
             except Exception as e:
-                print(f"⚠️ Streams erreur pour {a.id} : {e}")
+                print(f"⚠️ Streams erreur pour {aid} : {e}")
         except Exception as outer_e:
-            print(f"❌ Activité {a.id} plantée : {outer_e}")
-
-    dump_jsonl(kudos, os.path.join(DATA_DIR, f"{prefix}strava_kudos.jsonl"))
-    dump_jsonl(comments, os.path.join(DATA_DIR, f"{prefix}strava_comments.jsonl"))
-    dump_jsonl(laps, os.path.join(DATA_DIR, f"{prefix}strava_laps.jsonl"))
-    dump_jsonl(streams, os.path.join(DATA_DIR, f"{prefix}strava_streams.jsonl"))
+            print(f"❌ Activité {aid} plantée : {outer_e}")
+
+    # Les quatre dumps sont indépendants : écrits en parallèle
+    dumps = {"kudos": kudos, "comments": comments, "laps": laps, "streams": streams}
+    with ThreadPoolExecutor(max_workers=len(dumps)) as executor:
+        list(
+            executor.map(
+                lambda item: dump_jsonl(
+                    item[1], os.path.join(DATA_DIR, f"{prefix}strava_{item[0]}.jsonl")
+                ),
+                dumps.items(),
+            )
+        )
 
     # Optionnel : Dump tes gears (chaussures, vélo...) et clubs
     gears = []
@@ -18,11 +18,25 @@ Usage:
 """
 
 import argparse
-from datetime import datetime, timezone
+import io
 from google.cloud import bigquery, storage
+from google.cloud.exceptions import NotFound
 import os
 import json
 
+# Rows BigQuery may reject per file before the whole load job fails
+MAX_BAD_RECORDS = 100
+
+# BigQuery → Arrow type mapping used when transcoding rows to Parquet.
+# TIMESTAMP is staged as STRING then cast, Arrow parses ISO-8601 natively.
+_ARROW_TYPE_NAMES = {
+    "STRING": "string",
+    "INTEGER": "int64",
+    "FLOAT": "float64",
+    "BOOLEAN": "bool_",
+    "TIMESTAMP": "string",
+}
+
 
 # Environment configuration
 def get_env_config(env: str):
@@ -36,6 +50,17 @@ def get_env_config(env: str):
         raise ValueError("Env must be 'dev' or 'prd'.")
 
 
+# Load timestamp filled in server-side: rows never carry this column, BigQuery
+# applies the default when it is absent from the loaded data.
+INSERTED_AT_DEFAULT = "CURRENT_TIMESTAMP()"
+dp_inserted_at_field = bigquery.SchemaField(
+    "dp_inserted_at",
+    "TIMESTAMP",
+    "NULLABLE",
+    default_value_expression=INSERTED_AT_DEFAULT,
+)
+
+
 # Strava Activities Schema
 strava_activities_schema = [
     bigquery.SchemaField("resource_state", "INTEGER", "NULLABLE"),
@@ -199,7 +224,7 @@ strava_activities_schema = [
         ),
     ),
     # Metadata fields
-    bigquery.SchemaField("dp_inserted_at", "TIMESTAMP", "NULLABLE"),
+    dp_inserted_at_field,
     bigquery.SchemaField("source_file", "STRING", "NULLABLE"),
 ]
 
@@ -260,7 +285,7 @@ strava_athlete_schema = [
         ),
     ),
     # Metadata fields
-    bigquery.SchemaField("dp_inserted_at", "TIMESTAMP", "NULLABLE"),
+    dp_inserted_at_field,
     bigquery.SchemaField("source_file", "STRING", "NULLABLE"),
 ]
 
@@ -275,7 +300,7 @@ strava_streams_schema = [
     bigquery.SchemaField("original_size", "INTEGER", "NULLABLE"),
     bigquery.SchemaField("resolution", "STRING", "NULLABLE"),
     # Metadata fields
-    bigquery.SchemaField("dp_inserted_at", "TIMESTAMP", "NULLABLE"),
+    dp_inserted_at_field,
     bigquery.SchemaField("source_file", "STRING", "NULLABLE"),
 ]
 
@@ -289,7 +314,7 @@ strava_kudos_schema = [
     bigquery.SchemaField("profile_medium", "STRING", "NULLABLE"),
     bigquery.SchemaField("created_at", "STRING", "NULLABLE"),
     # Metadata fields
-    bigquery.SchemaField("dp_inserted_at", "TIMESTAMP", "NULLABLE"),
+    dp_inserted_at_field,
     bigquery.SchemaField("source_file", "STRING", "NULLABLE"),
 ]
 
@@ -315,7 +340,7 @@ strava_laps_schema = [
     bigquery.SchemaField("lap_index", "INTEGER", "NULLABLE"),
     bigquery.SchemaField("split", "INTEGER", "NULLABLE"),
     # Metadata fields
-    bigquery.SchemaField("dp_inserted_at", "TIMESTAMP", "NULLABLE"),
+    dp_inserted_at_field,
     bigquery.SchemaField("source_file", "STRING", "NULLABLE"),
 ]
 
@@ -372,7 +397,72 @@ def move_gcs_file(bucket_name: str, source_path: str, dest_prefix: str):
     print(f"📁 {source_path} moved to {dest_path}")
 
 
-def load_jsonl_with_metadata(uri: str, table_id: str, inserted_at: str, file_type: str):
+def _arrow_field(field: bigquery.SchemaField, cast_timestamps: bool):
+    """Convert a BigQuery SchemaField into the equivalent pyarrow field."""
+    import pyarrow as pa
+
+    if field.field_type == "RECORD":
+        arrow_type = pa.struct(
+            [_arrow_field(sub, cast_timestamps) for sub in field.fields]
+        )
+    elif field.field_type == "TIMESTAMP" and cast_timestamps:
+        arrow_type = pa.timestamp("us")
+    else:
+        arrow_type = getattr(pa, _ARROW_TYPE_NAMES[field.field_type])()
+
+    if field.mode == "REPEATED":
+        arrow_type = pa.list_(arrow_type)
+    return pa.field(field.name, arrow_type)
+
+
+def transcode_rows_to_parquet(
+    rows: list, schema: list, bucket_name: str, blob_path: str
+) -> str:
+    """
+    Encode validated rows as a zstd Parquet file and upload it next to the JSONL.
+
+    Parquet is columnar and dictionary-encoded, so repeated keys and
+    low-cardinality values (type, sport_type, ...) are stored once per column
+    chunk and BigQuery skips JSON parsing entirely at load time.
+
+    Returns: GCS URI of the uploaded Parquet file.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # Columns with a server-side default must be absent from the file (an
+    # explicit NULL column would override the default).
+    fields = [f for f in schema if f.default_value_expression is None]
+    staging_schema = pa.schema([_arrow_field(f, False) for f in fields])
+    target_schema = pa.schema([_arrow_field(f, True) for f in fields])
+    table = pa.Table.from_pylist(rows, schema=staging_schema).cast(target_schema)
+
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, compression="zstd", use_dictionary=True)
+    buffer.seek(0)
+
+    client = storage.Client()
+    blob = client.bucket(bucket_name).blob(blob_path)
+    blob.upload_from_file(buffer, content_type="application/vnd.apache.parquet")
+    return f"gs://{bucket_name}/{blob_path}"
+
+
+def ensure_inserted_at_default(bq_client: bigquery.Client, table_id: str):
+    """Set the dp_inserted_at default on tables created before it existed."""
+    try:
+        table = bq_client.get_table(table_id)
+    except NotFound:
+        return  # Created by the first load job, default included
+    for field in table.schema:
+        if field.name == "dp_inserted_at" and not field.default_value_expression:
+            bq_client.query(
+                f"ALTER TABLE `{table_id}` ALTER COLUMN dp_inserted_at "
+                f"SET DEFAULT {INSERTED_AT_DEFAULT}"
+            ).result()
+            print(f"🕒 dp_inserted_at default set on {table_id}")
+
+
+def load_jsonl_with_metadata(uri: str, table_id: str, file_type: str):
     """Load JSONL file from GCS to BigQuery with Strava-specific validation."""
     from google.cloud import bigquery, storage
     import json
@@ -394,58 +484,22 @@ def load_jsonl_with_metadata(uri: str, table_id: str, inserted_at: str, file_typ
         try:
             data = json.loads(line)
 
-            # Add metadata
-            data["dp_inserted_at"] = inserted_at
+            # Add metadata (dp_inserted_at is filled in by BigQuery)
             data["source_file"] = filename
 
             # Strava-specific data validation
             if file_type == "activities":
-                # Ensure required fields exist
+                # Ensure required fields exist. Missing RECORD / REPEATED
+                # fields are left as-is: the schema declares them NULLABLE /
+                # REPEATED and BigQuery fills them in on load.
                 if "id" not in data or data["id"] is None:
                     continue  # Skip invalid activities
 
-                # Handle GPS coordinates properly
-                if "start_latlng" in data and data["start_latlng"]:
-                    if not isinstance(data["start_latlng"], list):
-                        data["start_latlng"] = []
-
-                if "end_latlng" in data and data["end_latlng"]:
-                    if not isinstance(data["end_latlng"], list):
-                        data["end_latlng"] = []
-
-                # Ensure splits are lists
-                if "splits_metric" not in data:
-                    data["splits_metric"] = []
-                elif not isinstance(data["splits_metric"], list):
-                    data["splits_metric"] = []
-
-                if "splits_standard" not in data:
-                    data["splits_standard"] = []
-                elif not isinstance(data["splits_standard"], list):
-                    data["splits_standard"] = []
-
-                # Ensure laps are lists
-                if "laps" not in data:
-                    data["laps"] = []
-                elif not isinstance(data["laps"], list):
-                    data["laps"] = []
-
-                # Handle athlete record properly
-                if "athlete" not in data or data["athlete"] is None:
-                    data["athlete"] = {}
-
             elif file_type == "athlete":
                 # Validate athlete data
                 if "id" not in data:
                     continue
 
-                # Ensure bikes, shoes are lists
-                for list_field in ["bikes", "shoes"]:
-                    if list_field not in data:
-                        data[list_field] = []
-                    elif not isinstance(data[list_field], list):
-                        data[list_field] = []
-
             elif file_type == "streams":
                 # Ensure streams have activity reference
                 if "activity_id" not in data:
@@ -487,17 +541,55 @@ def load_jsonl_with_metadata(uri: str, table_id: str, inserted_at: str, file_typ
     # Get appropriate schema and load to BigQuery
     schema = get_schema_for_type(file_type)
 
+    # Malformed rows (wrong shape for a REPEATED/RECORD field, ...) are
+    # rejected by the loader itself instead of being patched up in Python.
+    tolerance = dict(ignore_unknown_values=True, max_bad_records=MAX_BAD_RECORDS)
+
     bq_client = bigquery.Client()
-    job = bq_client.load_table_from_json(
-        rows,
-        table_id,
-        job_config=bigquery.LoadJobConfig(
-            schema=schema,
-            write_disposition="WRITE_APPEND",
-            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
-        ),
-    )
-    job.result()
+
+    # Preferred path: columnar Parquet staged in GCS, loaded server-side.
+    # Rows whose values do not fit the declared types fall back to JSON,
+    # where BigQuery applies its own (more lenient) coercion rules.
+    parquet_path = f"strava/staging/{filename.removesuffix('.jsonl')}.parquet"
+    try:
+        parquet_uri = transcode_rows_to_parquet(rows, schema, bucket_name, parquet_path)
+    except (ImportError, ValueError, TypeError) as e:
+        print(f"⚠️  Parquet transcode skipped for {filename}: {e}")
+        parquet_uri = None
+
+    if parquet_uri:
+        parquet_options = bigquery.ParquetOptions()
+        parquet_options.enable_list_inference = True
+        job = bq_client.load_table_from_uri(
+            parquet_uri,
+            table_id,
+            job_config=bigquery.LoadJobConfig(
+                schema=schema,
+                write_disposition="WRITE_APPEND",
+                source_format=bigquery.SourceFormat.PARQUET,
+                parquet_options=parquet_options,
+                **tolerance,
+            ),
+        )
+        try:
+            job.result()
+        finally:
+            bucket.blob(parquet_path).delete()
+    else:
+        job = bq_client.load_table_from_json(
+            rows,
+            table_id,
+            job_config=bigquery.LoadJobConfig(
+                schema=schema,
+                write_disposition="WRITE_APPEND",
+                source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+                **tolerance,
+            ),
+        )
+        job.result()
+
+    if job.errors:
+        print(f"⚠️  {len(job.errors)} rows rejected by BigQuery in {filename}")
     print(f"✅ {filename} loaded with {len(rows)} rows to {table_id}")
 
 
@@ -518,7 +610,8 @@ if __name__ == "__main__":
     config = get_env_config(args.env)
     bucket = config["bucket"]
     dataset = config["bq_dataset"]
-    inserted_at = datetime.utcnow().isoformat()
+    bq_client = bigquery.Client()
+    checked_tables = set()
 
     print(f"🔍 Searching for Strava files in gs://{bucket}/strava/landing/")
     uris = list_gcs_files(bucket)
@@ -532,8 +625,12 @@ if __name__ == "__main__":
             # Route to appropriate BigQuery table
             table_id = f"{project_id}.{dataset}.staging_strava_{file_type}"
 
+            if table_id not in checked_tables:
+                ensure_inserted_at_default(bq_client, table_id)
+                checked_tables.add(table_id)
+
             print(f"📊 Processing {file_type} file: {filename}")
-            load_jsonl_with_metadata(uri, table_id, inserted_at, file_type)
+            load_jsonl_with_metadata(uri, table_id, file_type)
 
             # Move to archive on success
             source_path = "/".join(uri.split("/")[3:])
@@ -1,13 +1,46 @@
 import os
+import csv
+import io
+import gzip
 import json
 import logging
+from functools import lru_cache
 from dotenv import load_dotenv
 import yaml
 from typing import Union, List, TYPE_CHECKING
 
+try:
+    import orjson
+except ImportError:  # orjson optionnel, repli sur json
+    orjson = None
+
 if TYPE_CHECKING:
     import pandas as pd
 
+# Niveau gzip des CSV "*.gz" : 1 est plusieurs fois plus rapide que le niveau
+# 9 par défaut pour un taux de compression proche sur du texte JSON
+GZIP_LEVEL = 1
+
+# Taille du buffer d'écriture JSONL : les lignes sont regroupées en écritures de 1 MiB
+JSONL_BUFFER_SIZE = 1 << 20
+
+
+def _dumps(obj) -> str:
+    """Sérialise en JSON compact (orjson si disponible, sinon json)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _encode_nested(values: list) -> list:
+    """JSON-encode dict / list items of a plain list, other values unchanged.
+
+    Works on ``Series.tolist()`` output: a list comprehension with an exact
+    type check avoids pandas' per-element ``map`` dispatch.
+    """
+    dumps = _dumps
+    return [dumps(v) if type(v) is dict or type(v) is list else v for v in values]
+
 
 def setup_logger():
     logging.basicConfig(
@@ -17,8 +50,15 @@ def setup_logger():
     )
 
 
-def get_token(env_var: str) -> str:
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Charge le fichier .env une seule fois par processus."""
     load_dotenv()
+
+
+@lru_cache(maxsize=8)
+def get_token(env_var: str) -> str:
+    _load_env()
     token = os.getenv(env_var)
     if not token:
         raise RuntimeError(f"Vous devez définir la variable d'environnement {env_var}")
@@ -31,20 +71,79 @@ def get_settings():
         return yaml.safe_load(f)
 
 
-def dump_nested_csv(df: "pd.DataFrame", filename: str) -> None:
-    """Dump nested CSV using pandas. Requires pandas to be installed."""
+def _open_csv(filename: str):
+    """Ouvre le fichier de sortie en binaire, gzip niveau 1 si "*.gz"."""
+    if not filename.endswith(".gz"):
+        return open(filename, "wb")
+
+    # mtime=0 : sortie déterministe pour un même contenu
+    return gzip.GzipFile(filename, "wb", compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _to_csv(df: "pd.DataFrame", filename: str) -> None:
+    """DataFrame.to_csv avec le même niveau gzip que le writer pyarrow."""
+    compression = "infer"
+    if filename.endswith(".gz"):
+        compression = {"method": "gzip", "compresslevel": GZIP_LEVEL, "mtime": 0}
+    df.to_csv(filename, index=False, compression=compression)
+
+
+def _write_csv_fallback(df: "pd.DataFrame", filename: str) -> None:
+    """CSV sans pyarrow : chemin rapide pour les frames purement numériques.
+
+    Sans NaN, chaque ligne se formate avec une seule chaîne ``%s,%s,...`` sur
+    des valeurs Python natives (entiers exacts, float au repr le plus court),
+    bien moins coûteux que la boucle de ``DataFrame.to_csv`` pour le même texte.
+    """
+    numeric = all(dtype.kind in "iuf" for dtype in df.dtypes)
+    if not numeric or df.isna().to_numpy().any():
+        _to_csv(df, filename)
+        return
+
+    header = io.StringIO()
+    csv.writer(header, lineterminator="\n").writerow(df.columns)
+    columns = [df[col].tolist() for col in df.columns]
+    row_fmt = ",".join(["%s"] * len(columns)) + "\n"
+    with _open_csv(filename) as f:
+        f.write(header.getvalue().encode("utf-8"))
+        f.writelines((row_fmt % row).encode("utf-8") for row in zip(*columns))
+
+
+def dump_nested_csv(df: "pd.DataFrame", filename: str, flatten: bool = False) -> None:
+    """Dump nested CSV using pandas. Requires pandas to be installed.
+
+    Nested dict / list cells are JSON-encoded cell by cell. With
+    ``flatten=True``, nested dicts (e.g. Strava ``athlete`` / ``map``) are
+    first flattened once into scalar ``parent_child`` columns with
+    ``pd.json_normalize``, so only the columns still holding lists are
+    encoded. A ``filename`` ending in ``.gz`` is gzip-compressed at level 1.
+    """
     import pandas as pd
 
-    for col in df.columns:
-        if df[col].apply(lambda x: isinstance(x, (dict, list))).any():
-            df[col] = df[col].apply(
-                lambda x: (
-                    json.dumps(x, ensure_ascii=False)
-                    if isinstance(x, (dict, list))
-                    else x
-                )
-            )
-    df.to_csv(filename, index=False)
+    if flatten:
+        df = pd.json_normalize(df.to_dict("records"), sep="_", max_level=2)
+
+    # Only object columns can hold lists; detection and encoding are fused
+    # into a single pass per column.
+    for col in df.select_dtypes(include="object").columns:
+        df[col] = _encode_nested(df[col].tolist())
+
+    # Writer CSV C++ de pyarrow, repli sur pandas si indisponible ou si une
+    # colonne mélange des types qu'Arrow ne sait pas unifier
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        _write_csv_fallback(df, filename)
+        return
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except pa.ArrowException:
+        _write_csv_fallback(df, filename)
+        return
+    with _open_csv(filename) as f:
+        pa_csv.write_csv(table, f, write_options=pa_csv.WriteOptions(batch_size=8192))
 
 
 def to_jsonl(
@@ -64,7 +163,16 @@ def to_jsonl(
     else:
         items = data
 
-    with open(jsonl_output_path, "w", encoding="utf-8") as fout:
+    if orjson is not None:
+        # Écriture directe en bytes, une ligne par objet
+        options = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        with open(jsonl_output_path, "wb", buffering=JSONL_BUFFER_SIZE) as fout:
+            fout.writelines(orjson.dumps(item, option=options) for item in items)
+        return
+
+    with open(
+        jsonl_output_path, "w", encoding="utf-8", buffering=JSONL_BUFFER_SIZE
+    ) as fout:
         for item in items:
             json.dump(item, fout, ensure_ascii=False)
             fout.write("\n")
@@ -8,8 +8,10 @@ import argparse
 import logging
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
 from datetime import datetime
 
 # Setup logging
@@ -20,14 +22,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def upload_to_gcs(bucket_name: str, source_file: Path, destination_blob_name: str) -> bool:
-    """Uploads a file to the bucket."""
+MAX_WORKERS = 8
+# Files above this size are uploaded as concurrent chunks composed server-side
+CHUNKED_UPLOAD_THRESHOLD = 32 * 1024 * 1024
+CHUNK_SIZE = 8 * 1024 * 1024
+
+def upload_to_gcs(storage_client: storage.Client, bucket_name: str, source_file: Path, destination_blob_name: str) -> bool:
+    """Uploads a file to the bucket using a shared storage client."""
     try:
-        storage_client = storage.Client()
         bucket = storage_client.bucket(bucket_name)
         blob = bucket.blob(destination_blob_name)
 
-        blob.upload_from_filename(str(source_file))
+        if source_file.stat().st_size > CHUNKED_UPLOAD_THRESHOLD:
+            transfer_manager.upload_chunks_concurrently(
+                str(source_file),
+                blob,
+                chunk_size=CHUNK_SIZE,
+                max_workers=MAX_WORKERS,
+            )
+        else:
+            blob.upload_from_filename(str(source_file))
         
         logger.info(f"✅ Uploaded {source_file.name} to gs://{bucket_name}/{destination_blob_name}")
         return True
@@ -66,22 +80,34 @@ def main():
 
     logger.info(f"📦 Found {len(files)} files to process")
     
-    success_count = 0
-    error_count = 0
-    
-    for file_path in files:
+    # One client (and its HTTP connection pool) for every upload
+    storage_client = storage.Client()
+
+    def move_file(file_path: Path):
+        """Upload one file then delete it locally.
+
+        Returns True if moved, False if the upload failed, None if only the
+        local deletion failed.
+        """
         filename = file_path.name
         destination_blob_name = f"{dest_prefix}{filename}"
-        
-        if upload_to_gcs(args.bucket, file_path, destination_blob_name):
-            try:
-                os.remove(file_path)
-                logger.info(f"🗑️  Deleted local file: {filename}")
-                success_count += 1
-            except OSError as e:
-                logger.error(f"⚠️  Failed to delete local file {filename}: {e}")
-        else:
-            error_count += 1
+
+        if not upload_to_gcs(storage_client, args.bucket, file_path, destination_blob_name):
+            return False
+        try:
+            os.remove(file_path)
+            logger.info(f"🗑️  Deleted local file: {filename}")
+            return True
+        except OSError as e:
+            logger.error(f"⚠️  Failed to delete local file {filename}: {e}")
+            return None
+
+    # Files are independent objects: upload them concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(move_file, files))
+
+    success_count = results.count(True)
+    error_count = results.count(False)
             
     logger.info(f"\n📈 Upload Summary:")
     logger.info(f"✅ Moved: {success_count} files")
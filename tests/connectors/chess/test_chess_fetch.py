@@ -0,0 +1,138 @@
+import calendar
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.connectors.chess import chess_fetch
+from src.connectors.chess.chess_fetch import (
+    BASE_URL,
+    ChessComConfig,
+    ChessComConnector,
+    _month_bounds,
+)
+
+
+def utc(*args) -> int:
+    return calendar.timegm(datetime(*args).timetuple())
+
+
+# Games of each monthly archive, keyed by "YYYY/MM"
+ARCHIVES = {
+    "2024/01": [
+        {"uuid": "jan-before", "end_time": utc(2024, 1, 14, 23, 59, 59)},
+        {"uuid": "jan-start", "end_time": utc(2024, 1, 15)},
+        {"uuid": "jan-last", "end_time": utc(2024, 1, 31, 23, 59, 59)},
+    ],
+    "2024/02": [
+        {"uuid": "feb-first", "end_time": utc(2024, 2, 1)},
+        {"uuid": "feb-leap", "end_time": utc(2024, 2, 29, 23, 59, 59)},
+    ],
+    "2024/03": [
+        {"uuid": "mar-first", "end_time": utc(2024, 3, 1)},
+        {"uuid": "mar-end", "end_time": utc(2024, 3, 10)},
+        {"uuid": "mar-after", "end_time": utc(2024, 3, 10, 0, 0, 1)},
+    ],
+}
+
+
+@pytest.fixture(autouse=True)
+def utc_local_time(monkeypatch):
+    """Naive range bounds are local time: pin it to UTC, like the archives."""
+    monkeypatch.setenv("TZ", "UTC")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.fixture(params=[True, False], ids=["ijson", "no-ijson"])
+def connector(request, monkeypatch, tmp_path):
+    # Boundary months stream through ijson when it is installed
+    monkeypatch.setattr(chess_fetch, "ijson", object() if request.param else None)
+
+    connector = ChessComConnector(
+        ChessComConfig(username="player", output_dir=tmp_path)
+    )
+    prefix = f"{BASE_URL}/player/player/games/"
+    connector._archives = ([prefix + ym for ym in ARCHIVES], "player")
+
+    def games_of(endpoint):
+        year_month = endpoint.split("/games/")[1]
+        return [dict(game) for game in ARCHIVES[year_month]]
+
+    connector._make_request = lambda endpoint: {"games": games_of(endpoint)}
+    connector._stream_games = lambda endpoint: iter(games_of(endpoint))
+
+    full_months = {}
+    fetch_month_games = connector._fetch_month_games
+
+    def spy(username, year_month, start_ts, end_ts, fetch_ts, full_month=False):
+        full_months[year_month] = full_month
+        return fetch_month_games(
+            username, year_month, start_ts, end_ts, fetch_ts, full_month=full_month
+        )
+
+    connector._fetch_month_games = spy
+    connector.full_months = full_months
+    return connector
+
+
+def test_month_bounds_are_utc_month_edges():
+    assert _month_bounds(2024, 2) == (utc(2024, 2, 1), utc(2024, 2, 29, 23, 59, 59))
+    assert _month_bounds(2023, 2) == (utc(2023, 2, 1), utc(2023, 2, 28, 23, 59, 59))
+    assert _month_bounds(2023, 12) == (
+        utc(2023, 12, 1),
+        utc(2023, 12, 31, 23, 59, 59),
+    )
+
+
+def test_partial_first_and_last_months_are_filtered(connector):
+    games = connector.fetch_games(datetime(2024, 1, 15), datetime(2024, 3, 10))
+
+    assert [game["uuid"] for game in games] == [
+        "jan-start",
+        "jan-last",
+        "feb-first",
+        "feb-leap",
+        "mar-first",
+        "mar-end",
+    ]
+    assert connector.full_months == {
+        "2024/01": False,
+        "2024/02": True,
+        "2024/03": False,
+    }
+    assert all(game["data_type"] == "games" for game in games)
+    assert len({game["fetch_timestamp"] for game in games}) == 1
+
+
+def test_range_on_exact_utc_month_edges_is_a_full_month(connector):
+    games = connector.fetch_games(
+        datetime(2024, 2, 1), datetime(2024, 2, 29, 23, 59, 59)
+    )
+
+    assert connector.full_months == {"2024/02": True}
+    assert [game["uuid"] for game in games] == ["feb-first", "feb-leap"]
+
+
+def test_range_one_second_short_of_the_month_end_is_filtered(connector):
+    games = connector.fetch_games(
+        datetime(2024, 2, 1), datetime(2024, 2, 29, 23, 59, 58)
+    )
+
+    assert connector.full_months == {"2024/02": False}
+    assert [game["uuid"] for game in games] == ["feb-first"]
+
+
+def test_range_starting_one_second_into_the_month_is_filtered(connector):
+    games = connector.fetch_games(datetime(2024, 2, 1, 0, 0, 1), datetime(2024, 3, 31))
+
+    assert connector.full_months["2024/02"] is False
+    assert [game["uuid"] for game in games][:2] == ["feb-leap", "mar-first"]
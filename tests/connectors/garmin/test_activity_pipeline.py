@@ -0,0 +1,175 @@
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.connectors.garmin.fetcher import GarminFetcher
+
+START = datetime(2024, 1, 1)
+END = datetime(2024, 1, 31)
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    # Not a str: the fetcher lists activities with one get_activities_by_date call
+    client.garmin_connect_activities = None
+    client.get_activities_by_date.return_value = [
+        {"activityId": activity_id, "activityName": f"Run {activity_id}"}
+        for activity_id in (1, 2, 3, 4)
+    ]
+    return client
+
+
+@pytest.fixture
+def fetcher(client):
+    return GarminFetcher(client, cache_dir=None)
+
+
+async def collect(pipeline):
+    return [pair async for pair in pipeline]
+
+
+def test_pipeline_yields_in_list_order_when_completions_arrive_out_of_order(
+    fetcher, client
+):
+    completed = []
+
+    async def fetch_one(activity):
+        # Later activities finish first
+        await asyncio.sleep(0.01 * (5 - activity["activityId"]))
+        completed.append(activity["activityId"])
+        return activity["activityId"] * 10
+
+    async def run():
+        semaphore = asyncio.Semaphore(8)
+        return await collect(
+            fetcher._pipeline_activities(client, semaphore, START, END, fetch_one)
+        )
+
+    pairs = asyncio.run(run())
+
+    assert completed == [4, 3, 2, 1]
+    assert [(a["activityId"], result) for a, result in pairs] == [
+        (1, 10),
+        (2, 20),
+        (3, 30),
+        (4, 40),
+    ]
+
+
+def test_pipeline_passes_a_failed_activity_through_as_its_result(fetcher, client):
+    async def fetch_one(activity):
+        if activity["activityId"] == 2:
+            raise ValueError("no weather")
+        return "ok"
+
+    async def run():
+        semaphore = asyncio.Semaphore(8)
+        return await collect(
+            fetcher._pipeline_activities(client, semaphore, START, END, fetch_one)
+        )
+
+    pairs = asyncio.run(run())
+
+    results = [result for _, result in pairs]
+    assert len(results) == 4
+    assert isinstance(results[1], ValueError)
+    assert results[0] == results[2] == results[3] == "ok"
+
+
+def test_pipeline_raises_the_listing_error(fetcher, client):
+    client.get_activities_by_date.side_effect = RuntimeError("listing down")
+
+    async def fetch_one(activity):
+        return activity
+
+    async def run():
+        semaphore = asyncio.Semaphore(8)
+        return await collect(
+            fetcher._pipeline_activities(client, semaphore, START, END, fetch_one)
+        )
+
+    with pytest.raises(RuntimeError, match="listing down"):
+        asyncio.run(run())
+
+    # A failed listing is not memoized: the next metric lists again
+    assert fetcher._activity_listings == {}
+
+
+def test_pipeline_cancels_in_flight_fetches_on_early_aclose(fetcher, client):
+    cancelled = []
+
+    async def fetch_one(activity):
+        if activity["activityId"] == 1:
+            return "first"
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(activity["activityId"])
+            raise
+
+    async def run():
+        semaphore = asyncio.Semaphore(8)
+        pipeline = fetcher._pipeline_activities(
+            client, semaphore, START, END, fetch_one
+        )
+        first = await anext(pipeline)
+        await pipeline.aclose()
+        # Let the cancelled workers run their handlers
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        return first
+
+    activity, result = asyncio.run(run())
+
+    assert (activity["activityId"], result) == (1, "first")
+    assert sorted(cancelled) == [2, 3, 4]
+
+
+def test_second_metric_reuses_the_activity_listing(fetcher, client):
+    client.get_activity_weather.side_effect = lambda activity_id: {"temp": activity_id}
+    client.get_activity_hr_in_timezones.side_effect = lambda activity_id: [
+        {"zone": activity_id}
+    ]
+
+    weather = fetcher.fetch_metric("activity_weather", START, END)
+    hr_zones = fetcher.fetch_metric("activity_hr_zones", START, END)
+
+    assert len(weather) == len(hr_zones) == 4
+    assert client.get_activities_by_date.call_count == 1
+
+
+def test_concurrent_metrics_share_one_in_flight_listing(fetcher, client):
+    client.get_activity_weather.side_effect = lambda activity_id: {"temp": activity_id}
+    client.get_activity_hr_in_timezones.side_effect = lambda activity_id: [
+        {"zone": activity_id}
+    ]
+
+    async def run():
+        return await asyncio.gather(
+            fetcher.fetch_metric_async("activity_weather", START, END),
+            fetcher.fetch_metric_async("activity_hr_zones", START, END),
+        )
+
+    weather, hr_zones = asyncio.run(run())
+
+    assert len(weather) == len(hr_zones) == 4
+    assert client.get_activities_by_date.call_count == 1
+
+
+def test_new_range_lists_activities_again(fetcher, client):
+    client.get_activity_weather.side_effect = lambda activity_id: {"temp": activity_id}
+
+    fetcher.fetch_metric("activity_weather", START, END)
+    fetcher.fetch_metric("activity_weather", START, datetime(2024, 2, 29))
+
+    assert client.get_activities_by_date.call_count == 2
+    assert list(fetcher._activity_listings) == [("2024-01-01", "2024-02-29")]
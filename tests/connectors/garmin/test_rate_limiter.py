@@ -0,0 +1,145 @@
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.append(str(project_root))
+
+from src.connectors.garmin.utils import RateLimiter
+
+
+class FakeClock:
+    """time.monotonic replacement advanced by hand."""
+
+    def __init__(self, now: float = 100.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("src.connectors.garmin.utils.time.monotonic", fake):
+        yield fake
+
+
+def test_reserve_spaces_slots_by_interval(clock):
+    limiter = RateLimiter(4)  # one slot every 0.25 s
+
+    delays = [limiter._reserve() for _ in range(4)]
+
+    assert delays == pytest.approx([0.0, 0.25, 0.5, 0.75])
+
+
+def test_reserve_does_not_bank_idle_time(clock):
+    limiter = RateLimiter(4)
+    limiter._reserve()
+
+    clock.now += 10
+    delays = [limiter._reserve() for _ in range(2)]
+
+    assert delays == pytest.approx([0.0, 0.25])
+
+
+def test_reserve_lets_a_burst_through_then_spaces(clock):
+    limiter = RateLimiter(2, burst=3)  # interval 0.5 s
+
+    delays = [limiter._reserve() for _ in range(5)]
+
+    assert delays == pytest.approx([0.0, 0.0, 0.0, 0.5, 1.0])
+
+
+def test_burst_credit_refills_with_time(clock):
+    limiter = RateLimiter(2, burst=3)
+    for _ in range(3):
+        limiter._reserve()
+
+    # One interval later, one slot of credit is back
+    clock.now += 0.5
+    delays = [limiter._reserve() for _ in range(2)]
+
+    assert delays == pytest.approx([0.0, 0.5])
+
+
+def test_throttle_halves_rate_down_to_min_rate(clock):
+    limiter = RateLimiter(8, max_rate=16, min_rate=2)
+
+    limiter.throttle()
+    assert limiter.rate == 4
+    limiter.throttle()
+    assert limiter.rate == 2
+    limiter.throttle()
+    assert limiter.rate == 2
+
+
+def test_throttle_without_pause_only_widens_spacing(clock):
+    limiter = RateLimiter(4)
+
+    limiter.throttle()
+    delays = [limiter._reserve() for _ in range(2)]
+
+    assert delays == pytest.approx([0.0, 0.5])
+
+
+def test_throttle_pause_holds_next_slot_for_retry_after(clock):
+    limiter = RateLimiter(4)
+
+    limiter.throttle(pause=3.0)
+    delays = [limiter._reserve() for _ in range(2)]
+
+    # New rate 2/s: held 3 s, then spaced by 0.5 s
+    assert delays == pytest.approx([3.0, 3.5])
+
+
+def test_throttle_pause_is_not_swallowed_by_burst(clock):
+    limiter = RateLimiter(4, burst=6)
+
+    limiter.throttle(pause=3.0)
+    delays = [limiter._reserve() for _ in range(6)]
+
+    assert min(delays) == pytest.approx(3.0)
+
+
+def test_recover_raises_rate_and_caps_at_max_rate(clock):
+    limiter = RateLimiter(3, max_rate=10)
+    limiter.throttle()
+    throttled = limiter.rate
+
+    limiter.recover()
+    assert throttled < limiter.rate < 10
+
+    for _ in range(100):
+        limiter.recover()
+    assert limiter.rate == 10
+
+
+def test_recover_never_exceeds_max_rate_from_start(clock):
+    limiter = RateLimiter(5)
+
+    limiter.recover()
+
+    assert limiter.rate == 5
+
+
+def test_acquire_sleeps_for_the_reserved_delay(clock):
+    limiter = RateLimiter(4)
+    slept = []
+
+    async def fake_sleep(delay):
+        slept.append(delay)
+
+    async def run():
+        for _ in range(3):
+            await limiter.acquire()
+
+    with patch("src.connectors.garmin.utils.asyncio.sleep", fake_sleep):
+        asyncio.run(run())
+
+    # The first slot is free: no sleep at all
+    assert slept == pytest.approx([0.25, 0.5])
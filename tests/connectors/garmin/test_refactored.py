@@ -56,9 +56,14 @@ def test_refactored_execution_flow(mock_garmin_client, mock_args):
         # Verify write_jsonl was called 3 times
         assert mock_write.call_count == 3
         
-        # Verify data structure
-        sleep_call_args = mock_write.call_args_list[0]
-        data, output_path = sleep_call_args[0]
+        # Verify data structure (metrics are written as they complete, in any order)
+        sleep_calls = [
+            call_args for call_args in mock_write.call_args_list
+            if call_args[0][1].name.endswith("_garmin_sleep.jsonl")
+        ]
+        assert len(sleep_calls) == 1
+        data, output_path, append = sleep_calls[0][0]
+        assert not append
         
         # Should still be 2 items (today + yesterday)
         assert len(data) == 2
@@ -0,0 +1,63 @@
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.append(str(project_root))
+
+pytest.importorskip("google.cloud.bigquery")
+pytest.importorskip("google.cloud.storage")
+
+from src.connectors.spotify.spotify_ingest import DataTransformer
+
+transform = DataTransformer.transform
+
+
+def test_timestamp_string_parsed_naive():
+    value = transform("2024-03-01 10:34:56", "timestamp_ms_to_timestamp")
+    assert value == datetime(2024, 3, 1, 10, 34, 56)
+    assert value.tzinfo is None
+
+
+def test_timestamp_string_without_leading_zeros():
+    # strptime accepted these, the fast path must not narrow the format
+    value = transform("2024-3-1 9:05:06", "timestamp_ms_to_timestamp")
+    assert value == datetime(2024, 3, 1, 9, 5, 6)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-03-01T10:34:56",
+        "2024-03-01 10:34:56+02:00",
+        "2024-03-01",
+        "2024-W09-5",
+    ],
+)
+def test_timestamp_rejects_other_iso_forms(value):
+    assert transform(value, "timestamp_ms_to_timestamp") is None
+    assert transform(value, "timestamp_ms_to_date") is None
+
+
+def test_string_to_date():
+    assert transform("2024-03-01", "string_to_date") == date(2024, 3, 1)
+    assert transform("2024-03-01T10:00:00", "string_to_date") == date(2024, 3, 1)
+    assert transform("20240301", "string_to_date") is None
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024", date(2024, 1, 1)),
+        ("2024-03", date(2024, 3, 1)),
+        ("2024-03-07", date(2024, 3, 7)),
+        ("+202", None),
+        ("2_02", None),
+        ("202403", None),
+    ],
+)
+def test_string_to_date_flexible(value, expected):
+    assert transform(value, "string_to_date_flexible") == expected
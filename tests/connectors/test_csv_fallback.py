@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+pd = pytest.importorskip("pandas")
+
+from src.connectors.utils import _write_csv_fallback
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        {"id": [1, 2, 12345678901234567], "elapsed_time": [3600, 0, -5]},
+        {"id": [1, 2], "distance, km": [1.5, 1e-05], "speed": [1e16, 0.1]},
+        {"id": [1, 2], "distance": [1.5, float("nan")]},
+        {"id": [1, 2], "name": ["Morning Run", 'Say "hi"']},
+    ],
+)
+def test_fallback_matches_to_csv(frame, tmp_path):
+    df = pd.DataFrame(frame)
+    out = tmp_path / "out.csv"
+
+    _write_csv_fallback(df, str(out))
+
+    assert out.read_text(encoding="utf-8") == df.to_csv(index=False)